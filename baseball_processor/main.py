@@ -14,7 +14,7 @@ import json
 import argparse
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from .utils.constants import (
     BASE_DIR, CACHE_DIR, ROSTERS_DIR, PDF_DIR, OUTPUT_DIR,
@@ -27,19 +27,42 @@ from .website.generator import generate_website_from_data
 
 # Add parent directory for imports
 sys.path.insert(0, str(BASE_DIR))
-from ncaab_parser import parse_ncaab_pdf
+from parsers import parse_ncaab_pdf
 from name_matcher import NameMatcher, enrich_game_data
 from parsers.milb_api import process_all_milb_games, process_milb_game
 from parsers.partner_leagues import process_all_partner_games, process_partner_game
 from player_crossover import PlayerCrossover
 
 
+def _cache_path(file_path: str) -> Path:
+    """Cache file for a PDF's parsed data."""
+    filename_no_ext = os.path.splitext(os.path.basename(file_path))[0]
+    safe_filename = re.sub(r'[^\w\-_]', '_', filename_no_ext)
+    return CACHE_DIR / f"{safe_filename}.json"
+
+
+def _needs_parse(file_path: str, use_cache: bool) -> bool:
+    """True unless the PDF has a cache entry at least as new as itself."""
+    cache_path = _cache_path(file_path)
+    return not (use_cache and cache_path.exists()
+                and os.path.getmtime(file_path) <= os.path.getmtime(cache_path))
+
+
+def _parse_pdf_safely(file_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parse a PDF, returning (game_data, None) or (None, error message)."""
+    try:
+        return parse_ncaab_pdf(file_path), None
+    except Exception as e:
+        return None, str(e)
+
+
 def process_pdf_file(
     file_path: str,
     matcher: Optional[NameMatcher] = None,
     use_cache: bool = True,
     index: Optional[int] = None,
     total: Optional[int] = None,
+    parsed: Optional[Tuple[Optional[Dict[str, Any]], Optional[str]]] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Process a single PDF file with caching support.
@@ -50,14 +73,14 @@ def process_pdf_file(
         use_cache: Whether to use/update cache
         index: Current file index (for progress)
         total: Total files (for progress)
+        parsed: _parse_pdf_safely result from a worker process, if the
+            PDF was already parsed
 
     Returns:
         Parsed game data dictionary
     """
     filename = os.path.basename(file_path)
-    filename_no_ext = os.path.splitext(filename)[0]
-    safe_filename = re.sub(r'[^\w\-_]', '_', filename_no_ext)
-    cache_path = CACHE_DIR / f"{safe_filename}.json"
+    cache_path = _cache_path(file_path)
 
     if index is not None and total is not None:
         print(f"[{index}/{total}] Processing: {filename}")
@@ -76,10 +99,16 @@ def process_pdf_file(
         else:
             print("  Cache outdated, re-parsing...")
 
-    # Parse PDF
-    try:
-        game_data = parse_ncaab_pdf(file_path)
+    # Parse PDF (unless a worker process already did)
+    if parsed is None:
+        parsed = _parse_pdf_safely(file_path)
+    game_data, error = parsed
+    if error is not None:
+        print(f"  ERROR: {error}")
+        return None
+    assert game_data is not None  # _parse_pdf_safely returns data when there's no error
 
+    try:
         meta = game_data.get('metadata', {})
         print(f"  {meta.get('away_team', '?')} vs {meta.get('home_team', '?')}")
         print(f"  Score: {meta.get('away_team_score', '?')} - {meta.get('home_team_score', '?')}")
@@ -259,8 +288,21 @@ def process_games(
         pdf_files = list(Path(input_path).glob("*.pdf"))
         print(f"Found {len(pdf_files)} PDF files")
 
+        # Parsing is CPU-bound, so PDFs without a fresh cache entry are parsed
+        # across processes up front; matching and caching stay in this process
+        to_parse = [str(f) for f in pdf_files if _needs_parse(str(f), use_cache)]
+        parsed = {}
+        if len(to_parse) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(to_parse) // (workers * 4))
+            print(f"Parsing {len(to_parse)} PDFs with {workers} workers...")
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                parsed = dict(zip(to_parse, ex.map(_parse_pdf_safely, to_parse, chunksize=chunksize)))
+
         for idx, pdf_file in enumerate(pdf_files, 1):
-            game = process_pdf_file(str(pdf_file), matcher, use_cache, idx, len(pdf_files))
+            game = process_pdf_file(str(pdf_file), matcher, use_cache, idx, len(pdf_files), parsed.get(str(pdf_file)))
             if game:
                 games.append(game)
     else:
@@ -12,6 +12,27 @@ from utils.names import normalize_name_for_matching, format_innings_pitched
 
 BREF_BASE = "https://www.baseball-reference.com"
 
+# Single-line row templates, filled with str.format() once per player
+_BATTING_ROW = (
+    '<tr><td class="player-cell">{}</td><td class="player-cell">{}</td>'
+    '<td class="pos-cell">{}</td>' + '<td class="stat-cell">{}</td>' * 10 + '</tr>'
+)
+_BATTING_TOTALS_ROW = (
+    '<tr class="totals-row"><td class="player-cell"></td>'
+    '<td class="player-cell"><strong>Totals</strong></td><td class="pos-cell"></td>'
+    + '<td class="stat-cell"><strong>{}</strong></td>' * 10 + '</tr>'
+)
+_PITCHING_ROW = (
+    '<tr><td class="player-cell">{}</td><td class="player-cell">{}</td>'
+    + '<td class="stat-cell">{}</td>' * 8 + '</tr>'
+)
+_PITCHING_TOTALS_ROW = (
+    '<tr class="totals-row"><td class="player-cell"></td>'
+    '<td class="player-cell"><strong>Totals</strong></td>'
+    + '<td class="stat-cell"><strong>{}</strong></td>' * 8 + '</tr>'
+)
+_INNING_CELL = '<td class="inning-cell">{}</td>'
+
 
 def generate_player_link(name: str, bref_id: Optional[str]) -> str:
     """Generate HTML for a player name with optional link."""
@@ -21,6 +42,28 @@ def generate_player_link(name: str, bref_id: Optional[str]) -> str:
     return f'<span class="player-name">{name}</span>'
 
 
+def _parse_hr_entries(home_runs: list) -> list:
+    """
+    Flatten game_notes HR entries into (player, game_count, season_total) tuples.
+
+    Entries are either dicts with 'player', 'game_count', 'season_total'
+    or plain strings (treated as one HR with no season total).
+    """
+    return [
+        (hr.get('player', ''), hr.get('game_count', 1), hr.get('season_total', ''))
+        if isinstance(hr, dict) else (str(hr), 1, '')
+        for hr in home_runs
+    ]
+
+
+def _hr_counts_from_entries(hr_entries: list) -> dict:
+    """Build the normalized-name -> HR count map from parsed HR entries."""
+    return {
+        normalize_name_for_matching(player_name): game_count
+        for player_name, game_count, _ in hr_entries
+    }
+
+
 def get_hr_counts_for_players(players: list, home_runs: list) -> dict:
     """
     Map home run counts from game_notes to players.
@@ -32,28 +75,19 @@ def get_hr_counts_for_players(players: list, home_runs: list) -> dict:
     Returns:
         Dict mapping player name (normalized) to HR count in this game
     """
-    hr_counts = {}
+    return _hr_counts_from_entries(_parse_hr_entries(home_runs))
 
-    for hr in home_runs:
-        if isinstance(hr, dict):
-            player_name = hr.get('player', '')
-            game_count = hr.get('game_count', 1)
-        else:
-            player_name = str(hr)
-            game_count = 1
 
-        # Normalize the name for matching
-        normalized = normalize_name_for_matching(player_name)
-        hr_counts[normalized] = game_count
+def match_player_hr(player: dict, hr_counts: dict, normalized: Optional[str] = None) -> int:
+    """Find HR count for a player by matching names.
 
-    return hr_counts
-
-
-def match_player_hr(player: dict, hr_counts: dict) -> int:
-    """Find HR count for a player by matching names."""
-    # Get player name from either full_name or name field
-    player_name = player.get('full_name') or player.get('name', '')
-    normalized = normalize_name_for_matching(player_name)
+    Pass ``normalized`` when the caller has already normalized the player's
+    name to skip normalizing it again.
+    """
+    if normalized is None:
+        # Get player name from either full_name or name field
+        player_name = player.get('full_name') or player.get('name', '')
+        normalized = normalize_name_for_matching(player_name)
 
     # Direct match
     if normalized in hr_counts:
@@ -70,24 +104,36 @@ def match_player_hr(player: dict, hr_counts: dict) -> int:
     return 0
 
 
-def generate_batting_table(players: list, team_name: str, home_runs: list = None) -> str:
-    """Generate HTML batting table for a team."""
+def generate_batting_table(
+    players: list,
+    team_name: str,
+    home_runs: list = None,
+    hr_counts: Optional[dict] = None
+) -> str:
+    """Generate HTML batting table for a team.
+
+    ``hr_counts`` may be passed in (from get_hr_counts_for_players) so both
+    teams' tables can share one HR lookup instead of rebuilding it from
+    ``home_runs`` per table.
+    """
     if not players:
         return ""
 
     # Build HR lookup from game notes
-    hr_counts = get_hr_counts_for_players(players, home_runs or [])
+    if hr_counts is None:
+        hr_counts = get_hr_counts_for_players(players, home_runs or [])
+
+    # Resolve and normalize each player's name once, up front
+    named_players = []
+    for p in players:
+        player_name = p.get('full_name') or p.get('name', '')
+        named_players.append((p, player_name, normalize_name_for_matching(player_name)))
 
     rows = []
-    totals = {
-        'ab': 0, 'r': 0, 'h': 0, 'rbi': 0, 'bb': 0, 'k': 0, 'hr': 0, 'po': 0, 'a': 0, 'lob': 0
-    }
+    total_hr = 0
 
-    for p in players:
-        name_html = generate_player_link(
-            p.get('full_name') or p.get('name', ''),
-            p.get('bref_id')
-        )
+    for p, player_name, normalized in named_players:
+        name_html = generate_player_link(player_name, p.get('bref_id'))
 
         # Get stats
         ab = p.get('at_bats', 0)
@@ -96,62 +142,34 @@ def generate_batting_table(players: list, team_name: str, home_runs: list = None
         rbi = p.get('rbi', 0)
         bb = p.get('walks', 0)
         k = p.get('strikeouts', 0)
-        hr = match_player_hr(p, hr_counts)
+        hr = match_player_hr(p, hr_counts, normalized)
         po = p.get('put_outs', 0)
         a = p.get('assists', 0)
         lob = p.get('left_on_base', 0)
 
-        # Update totals
-        totals['ab'] += ab
-        totals['r'] += r
-        totals['h'] += h
-        totals['rbi'] += rbi
-        totals['bb'] += bb
-        totals['k'] += k
-        totals['hr'] += hr
-        totals['po'] += po
-        totals['a'] += a
-        totals['lob'] += lob
+        # HR comes from game notes, so it is the only column tallied per row
+        total_hr += hr
 
         pos = p.get('position', '')
         num = p.get('number', '')
 
-        rows.append(f"""
-            <tr>
-                <td class="player-cell">{num}</td>
-                <td class="player-cell">{name_html}</td>
-                <td class="pos-cell">{pos}</td>
-                <td class="stat-cell">{ab}</td>
-                <td class="stat-cell">{r}</td>
-                <td class="stat-cell">{h}</td>
-                <td class="stat-cell">{hr}</td>
-                <td class="stat-cell">{rbi}</td>
-                <td class="stat-cell">{bb}</td>
-                <td class="stat-cell">{k}</td>
-                <td class="stat-cell">{po}</td>
-                <td class="stat-cell">{a}</td>
-                <td class="stat-cell">{lob}</td>
-            </tr>
-        """)
-
-    # Totals row
-    rows.append(f"""
-        <tr class="totals-row">
-            <td class="player-cell"></td>
-            <td class="player-cell"><strong>Totals</strong></td>
-            <td class="pos-cell"></td>
-            <td class="stat-cell"><strong>{totals['ab']}</strong></td>
-            <td class="stat-cell"><strong>{totals['r']}</strong></td>
-            <td class="stat-cell"><strong>{totals['h']}</strong></td>
-            <td class="stat-cell"><strong>{totals['hr']}</strong></td>
-            <td class="stat-cell"><strong>{totals['rbi']}</strong></td>
-            <td class="stat-cell"><strong>{totals['bb']}</strong></td>
-            <td class="stat-cell"><strong>{totals['k']}</strong></td>
-            <td class="stat-cell"><strong>{totals['po']}</strong></td>
-            <td class="stat-cell"><strong>{totals['a']}</strong></td>
-            <td class="stat-cell"><strong>{totals['lob']}</strong></td>
-        </tr>
-    """)
+        rows.append(_BATTING_ROW.format(num, name_html, pos, ab, r, h, hr, rbi, bb, k, po, a, lob))
+
+    # Totals row - sum each stat column once after the row loop
+    total_ab = sum(p.get('at_bats', 0) for p in players)
+    total_r = sum(p.get('runs', 0) for p in players)
+    total_h = sum(p.get('hits', 0) for p in players)
+    total_rbi = sum(p.get('rbi', 0) for p in players)
+    total_bb = sum(p.get('walks', 0) for p in players)
+    total_k = sum(p.get('strikeouts', 0) for p in players)
+    total_po = sum(p.get('put_outs', 0) for p in players)
+    total_a = sum(p.get('assists', 0) for p in players)
+    total_lob = sum(p.get('left_on_base', 0) for p in players)
+
+    rows.append(_BATTING_TOTALS_ROW.format(
+        total_ab, total_r, total_h, total_hr, total_rbi,
+        total_bb, total_k, total_po, total_a, total_lob
+    ))
 
     return f"""
     <div class="team-batting">
@@ -188,9 +206,6 @@ def generate_pitching_table(pitchers: list, team_name: str) -> str:
         return ""
 
     rows = []
-    totals = {
-        'ip': 0, 'h': 0, 'r': 0, 'er': 0, 'bb': 0, 'k': 0, 'bf': 0, 'np': 0
-    }
 
     for p in pitchers:
         name_html = generate_player_link(
@@ -207,46 +222,24 @@ def generate_pitching_table(pitchers: list, team_name: str) -> str:
         bf = p.get('batters_faced', 0)
         np = p.get('pitches', 0)
 
-        totals['ip'] += ip
-        totals['h'] += h
-        totals['r'] += r
-        totals['er'] += er
-        totals['bb'] += bb
-        totals['k'] += k
-        totals['bf'] += bf
-        totals['np'] += np
-
         num = p.get('number', '')
 
-        rows.append(f"""
-            <tr>
-                <td class="player-cell">{num}</td>
-                <td class="player-cell">{name_html}</td>
-                <td class="stat-cell">{format_innings_pitched(ip)}</td>
-                <td class="stat-cell">{h}</td>
-                <td class="stat-cell">{r}</td>
-                <td class="stat-cell">{er}</td>
-                <td class="stat-cell">{bb}</td>
-                <td class="stat-cell">{k}</td>
-                <td class="stat-cell">{bf}</td>
-                <td class="stat-cell">{np}</td>
-            </tr>
-        """)
-
-    rows.append(f"""
-        <tr class="totals-row">
-            <td class="player-cell"></td>
-            <td class="player-cell"><strong>Totals</strong></td>
-            <td class="stat-cell"><strong>{format_innings_pitched(totals['ip'])}</strong></td>
-            <td class="stat-cell"><strong>{totals['h']}</strong></td>
-            <td class="stat-cell"><strong>{totals['r']}</strong></td>
-            <td class="stat-cell"><strong>{totals['er']}</strong></td>
-            <td class="stat-cell"><strong>{totals['bb']}</strong></td>
-            <td class="stat-cell"><strong>{totals['k']}</strong></td>
-            <td class="stat-cell"><strong>{totals['bf']}</strong></td>
-            <td class="stat-cell"><strong>{totals['np']}</strong></td>
-        </tr>
-    """)
+        rows.append(_PITCHING_ROW.format(num, name_html, format_innings_pitched(ip), h, r, er, bb, k, bf, np))
+
+    # Totals row - sum each stat column once after the row loop
+    total_ip = sum(p.get('innings_pitched', 0) for p in pitchers)
+    total_h = sum(p.get('hits', 0) for p in pitchers)
+    total_r = sum(p.get('runs', 0) for p in pitchers)
+    total_er = sum(p.get('earned_runs', 0) for p in pitchers)
+    total_bb = sum(p.get('walks', 0) for p in pitchers)
+    total_k = sum(p.get('strikeouts', 0) for p in pitchers)
+    total_bf = sum(p.get('batters_faced', 0) for p in pitchers)
+    total_np = sum(p.get('pitches', 0) for p in pitchers)
+
+    rows.append(_PITCHING_TOTALS_ROW.format(
+        format_innings_pitched(total_ip), total_h, total_r, total_er,
+        total_bb, total_k, total_bf, total_np
+    ))
 
     return f"""
     <div class="team-pitching">
@@ -294,22 +287,28 @@ def generate_line_score(game_data: dict) -> str:
 
     # Get errors from game notes
     errors = game_data.get('game_notes', {}).get('errors', [])
-    away_e = len([e for e in errors if away_team.lower() in str(e).lower()])
-    home_e = len(errors) - away_e  # Simple approximation
+    away_lower = away_team.lower()
+    away_e = home_e = 0
+    for e in errors:
+        if away_lower in str(e).lower():
+            away_e += 1
+        else:
+            home_e += 1  # Simple approximation
 
     # Generate inning headers
     num_innings = max(len(away_innings), len(home_innings), 9)
     inning_headers = ''.join(f'<th class="inning-cell">{i+1}</th>' for i in range(num_innings))
 
+    # Pad both lines out to num_innings once, then render every cell the same way
+    away_padded = list(away_innings) + ['-'] * (num_innings - len(away_innings))
+    home_padded = list(home_innings) + ['-'] * (num_innings - len(home_innings))
+    if len(home_innings) < num_innings:
+        # Home team didn't bat in the final inning
+        home_padded[-1] = 'X'
+
     # Generate inning cells
-    away_cells = ''.join(
-        f'<td class="inning-cell">{away_innings[i] if i < len(away_innings) else "-"}</td>'
-        for i in range(num_innings)
-    )
-    home_cells = ''.join(
-        f'<td class="inning-cell">{home_innings[i] if i < len(home_innings) else "X" if i == num_innings - 1 and len(home_innings) < num_innings else "-"}</td>'
-        for i in range(num_innings)
-    )
+    away_cells = ''.join([_INNING_CELL.format(v) for v in away_padded])
+    home_cells = ''.join([_INNING_CELL.format(v) for v in home_padded])
 
     return f"""
     <div class="line-score-container">
@@ -344,8 +343,12 @@ def generate_line_score(game_data: dict) -> str:
     """
 
 
-def generate_game_notes(game_data: dict) -> str:
-    """Generate the game notes section (2B, 3B, HR, etc.)."""
+def generate_game_notes(game_data: dict, hr_entries: Optional[list] = None) -> str:
+    """Generate the game notes section (2B, 3B, HR, etc.).
+
+    ``hr_entries`` may be passed in (from _parse_hr_entries) when the caller
+    has already parsed the game's HR list.
+    """
     notes = game_data.get('game_notes', {})
     sections = []
 
@@ -360,15 +363,12 @@ def generate_game_notes(game_data: dict) -> str:
 
     # Home runs
     if notes.get('home_runs'):
-        items = []
-        for hr in notes['home_runs']:
-            if isinstance(hr, dict):
-                player = hr.get('player', '')
-                count = hr.get('game_count', 1)
-                season = hr.get('season_total', '')
-                items.append(f"{player}{' ' + str(count) if count > 1 else ''}{' (' + str(season) + ')' if season else ''}")
-            else:
-                items.append(str(hr))
+        if hr_entries is None:
+            hr_entries = _parse_hr_entries(notes['home_runs'])
+        items = [
+            f"{player}{' ' + str(count) if count > 1 else ''}{' (' + str(season) + ')' if season else ''}"
+            for player, count, season in hr_entries
+        ]
         sections.append(f"<p><strong>HR:</strong> {'; '.join(items)}</p>")
 
     # Stolen bases
@@ -5,12 +5,22 @@ Contains the main generate_html_page function with CSS and page template,
 along with conversion functions and CLI.
 """
 
+import hashlib
+import inspect
 import json
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import name_matcher
+import utils.names
 from name_matcher import NameMatcher, enrich_game_data
 
+from . import components
 from .components import (
     BREF_BASE,
     generate_batting_table,
@@ -18,9 +28,30 @@ from .components import (
     generate_line_score,
     generate_game_notes,
     generate_game_info,
+    _parse_hr_entries,
+    _hr_counts_from_entries,
 )
 
 
+def _generator_fingerprint() -> bytes:
+    """Hash of the code that renders pages (this module and everything it renders with), so edits invalidate cached pages."""
+    h = hashlib.blake2b(digest_size=16)
+    for module in (sys.modules[__name__], components, name_matcher, utils.names):
+        h.update(Path(inspect.getfile(module)).read_bytes())
+    return h.digest()
+
+
+def _roster_fingerprint(roster_dir: Optional[str]) -> bytes:
+    """Hash of the roster files' names and contents, so roster edits invalidate cached pages."""
+    h = hashlib.blake2b(digest_size=16)
+    if roster_dir:
+        # The same files NameMatcher.load_rosters_from_dir reads
+        for json_file in sorted(Path(roster_dir).glob("*.json")):
+            h.update(json_file.name.encode() + b'\0')
+            h.update(hashlib.blake2b(json_file.read_bytes(), digest_size=16).digest())
+    return h.digest()
+
+
 def generate_html_page(game_data: dict) -> str:
     """Generate complete HTML page for a game."""
     meta = game_data.get('metadata', {})
@@ -39,6 +70,10 @@ def generate_html_page(game_data: dict) -> str:
 
     title = f"{away_display} vs {home_display} - Box Score"
 
+    # Parse the HR list once; share it with both batting tables and the notes
+    hr_entries = _parse_hr_entries(game_data.get('game_notes', {}).get('home_runs', []))
+    hr_counts = _hr_counts_from_entries(hr_entries)
+
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -276,8 +311,8 @@ def generate_html_page(game_data: dict) -> str:
             {generate_line_score(game_data)}
 
             <div class="box-scores">
-                {generate_batting_table(box_score.get('away_batting', []), away_team, game_data.get('game_notes', {}).get('home_runs', []))}
-                {generate_batting_table(box_score.get('home_batting', []), home_team, game_data.get('game_notes', {}).get('home_runs', []))}
+                {generate_batting_table(box_score.get('away_batting', []), away_team, hr_counts=hr_counts)}
+                {generate_batting_table(box_score.get('home_batting', []), home_team, hr_counts=hr_counts)}
             </div>
 
             <div class="pitching-section">
@@ -287,7 +322,7 @@ def generate_html_page(game_data: dict) -> str:
                 </div>
             </div>
 
-            {generate_game_notes(game_data)}
+            {generate_game_notes(game_data, hr_entries)}
         </div>
 
         <div class="footer">
@@ -299,6 +334,38 @@ def generate_html_page(game_data: dict) -> str:
 </html>"""
 
 
+# Roster matcher for batch worker processes, loaded once by _init_worker
+_MATCHER: Optional[NameMatcher] = None
+
+
+def _init_worker(matcher_path: Optional[str]) -> None:
+    """Load the pickled NameMatcher once per worker process."""
+    global _MATCHER
+    if matcher_path:
+        with open(matcher_path, 'rb') as f:
+            _MATCHER = pickle.load(f)
+
+
+def _render_game(raw: bytes, html_path: str, matcher: Optional[NameMatcher] = None) -> str:
+    """Render one game's JSON bytes to an HTML file and return its path."""
+    game_data = json.loads(raw)
+
+    # Enrich with bref_ids
+    matcher = matcher or _MATCHER
+    if matcher:
+        game_data = enrich_game_data(game_data, matcher)
+
+    # Write HTML (encode once, single binary write)
+    Path(html_path).write_bytes(generate_html_page(game_data).encode('utf-8'))
+    return html_path
+
+
+def _render_game_file(json_path: str, html_path: str) -> str:
+    """Worker entry point: render a game JSON file using the process matcher."""
+    with open(json_path, 'rb') as f:
+        return _render_game(f.read(), html_path)
+
+
 def convert_game_to_html(
     game_json_path: str,
     output_path: Optional[str] = None,
@@ -334,9 +401,8 @@ def convert_game_to_html(
     if output_path is None:
         output_path = str(Path(game_json_path).with_suffix('.html'))
 
-    # Write HTML
-    with open(output_path, 'w') as f:
-        f.write(html)
+    # Write HTML (encode once, single binary write)
+    Path(output_path).write_bytes(html.encode('utf-8'))
 
     print(f"Generated HTML: {output_path}")
     return output_path
@@ -345,20 +411,32 @@ def convert_game_to_html(
 def convert_all_games(
     input_dir: str,
     output_dir: str,
-    roster_dir: Optional[str] = None
+    roster_dir: Optional[str] = None,
+    use_cache: bool = True,
+    workers: int = 1
 ) -> list:
     """
     Convert all game JSON files in a directory to HTML.
 
+    Unchanged games are skipped: a sidecar .hash file next to each HTML
+    page records a blake2b digest of the game JSON, the roster files (names
+    and contents) and the rendering sources (html_generator and
+    name_matcher), and the page is reused when the digest still matches.
+
+    With workers > 1, games are rendered in a process pool. The roster
+    matcher is pickled to a temp file once and loaded by each worker's
+    initializer rather than being sent along with every task.
+
     Args:
         input_dir: Directory with game JSON files
         output_dir: Directory for HTML output
         roster_dir: Optional directory with roster files
+        use_cache: Reuse previously generated HTML for unchanged inputs
+        workers: Number of worker processes (1 renders in-process)
 
     Returns:
         List of generated HTML file paths
     """
-    input_path = Path(input_dir)
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
 
@@ -370,27 +448,55 @@ def convert_all_games(
         print(f"Loaded {count} rosters for player matching")
 
     html_files = []
-
-    for json_file in sorted(input_path.glob("*.json")):
-        print(f"Processing: {json_file.name}")
-
-        # Load game data
-        with open(json_file, 'r') as f:
-            game_data = json.load(f)
-
-        # Enrich with bref_ids
-        if matcher:
-            game_data = enrich_game_data(game_data, matcher)
-
-        # Generate HTML
-        html = generate_html_page(game_data)
-
-        # Write HTML
-        html_path = output_path / json_file.with_suffix('.html').name
-        with open(html_path, 'w') as f:
-            f.write(html)
-
-        html_files.append(str(html_path))
+    fingerprint = _generator_fingerprint() + _roster_fingerprint(roster_dir)
+
+    # Scan the directory once and sort the entries in place by name
+    entries = [e for e in os.scandir(input_dir) if e.name.endswith('.json') and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+
+    pending = []  # (json path, html path, hash path, digest)
+    for entry in entries:
+        stem = entry.name[:-len('.json')]
+        html_path = output_path / (stem + '.html')
+        hash_path = output_path / (stem + '.hash')
+
+        # Skip games whose JSON (and generator/rosters) haven't changed
+        with open(entry.path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.blake2b(raw + fingerprint, digest_size=16).hexdigest()
+        if use_cache and html_path.exists() and hash_path.exists():
+            if hash_path.read_text(errors='ignore') == digest:
+                html_files.append(str(html_path))
+                continue
+
+        print(f"Processing: {entry.name}")
+
+        if workers > 1:
+            pending.append((entry.path, str(html_path), hash_path, digest))
+            continue
+
+        html_files.append(_render_game(raw, str(html_path), matcher))
+        hash_path.write_text(digest)
+
+    if pending:
+        matcher_path = None
+        try:
+            # Serialize the matcher once; workers load it in their initializer
+            if matcher:
+                with tempfile.NamedTemporaryFile('wb', suffix='.pkl', delete=False) as tmp:
+                    pickle.dump(matcher, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+                    matcher_path = tmp.name
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(matcher_path,)) as pool:
+                futures = [(pool.submit(_render_game_file, json_path, html_path), hash_path, digest)
+                           for json_path, html_path, hash_path, digest in pending]
+                for future, hash_path, digest in futures:
+                    html_files.append(future.result())
+                    hash_path.write_text(digest)
+        finally:
+            if matcher_path:
+                os.unlink(matcher_path)
 
     print(f"\nGenerated {len(html_files)} HTML files in {output_dir}")
     return html_files
@@ -404,7 +510,7 @@ def main():
         print("NCAA Baseball HTML Generator")
         print("\nUsage:")
         print("  python -m html_generator.page <game.json> [output.html] [--roster-dir DIR]")
-        print("  python -m html_generator.page --all <input_dir> <output_dir> [--roster-dir DIR]")
+        print("  python -m html_generator.page --all <input_dir> <output_dir> [--roster-dir DIR] [--workers N]")
         print("\nExamples:")
         print("  python -m html_generator.page output/game1.json")
         print("  python -m html_generator.page output/game1.json game1.html --roster-dir rosters")
@@ -417,11 +523,17 @@ def main():
         roster_dir = sys.argv[idx + 1]
         sys.argv = sys.argv[:idx] + sys.argv[idx + 2:]
 
+    workers = 1
+    if "--workers" in sys.argv:
+        idx = sys.argv.index("--workers")
+        workers = int(sys.argv[idx + 1])
+        sys.argv = sys.argv[:idx] + sys.argv[idx + 2:]
+
     if sys.argv[1] == "--all":
         if len(sys.argv) < 4:
             print("Error: --all requires input_dir and output_dir")
             sys.exit(1)
-        convert_all_games(sys.argv[2], sys.argv[3], roster_dir)
+        convert_all_games(sys.argv[2], sys.argv[3], roster_dir, workers=workers)
     else:
         game_path = sys.argv[1]
         output_path = sys.argv[2] if len(sys.argv) > 2 else None
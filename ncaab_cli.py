@@ -0,0 +1,108 @@
+"""
+Command-line interface for the NCAA baseball box score PDF parser.
+
+Converts a PDF into JSON next to it (or at the given output path) and
+prints a short preview of the parsed game.
+
+Run with --server to parse many PDFs in one process: read one PDF path
+per line on stdin and write one compact JSON document per line (NDJSON)
+to stdout. A PDF that fails to parse yields {"pdf": path, "error": msg}.
+
+Passing several .pdf paths converts them in parallel worker processes,
+writing each JSON next to its PDF.
+
+--backend pymupdf|playa extracts text with PyMuPDF or playa instead of
+pdfplumber (falls back to pdfplumber when the library isn't installed).
+
+--compact writes the JSON files without indentation.
+"""
+
+import sys
+
+
+def _convert_for_batch(pdf_path: str, backend: str = 'pdfplumber', indent: bool = True) -> tuple:
+    """Batch worker: write one PDF's JSON next to it and report (pdf, error)."""
+    from parsers import parse_ncaab_pdf, _save_json
+    try:
+        _save_json(parse_ncaab_pdf(pdf_path, backend), pdf_path, indent=indent)  # Keep the JSON text in the worker
+    except Exception as e:
+        return pdf_path, str(e)
+    return pdf_path, None
+
+
+def main() -> None:
+    from parsers import parse_ncaab_pdf, _save_json
+
+    backend = 'pdfplumber'
+    if "--backend" in sys.argv:
+        idx = sys.argv.index("--backend")
+        backend = sys.argv[idx + 1]
+        sys.argv = sys.argv[:idx] + sys.argv[idx + 2:]
+
+    indent = "--compact" not in sys.argv
+    if not indent:
+        sys.argv.remove("--compact")
+
+    if len(sys.argv) < 2:
+        print("Usage: python ncaab_cli.py <pdf_path> [output_path] [--backend pdfplumber|pymupdf|playa] [--compact]")
+        print("       python ncaab_cli.py <pdf_path> <pdf_path> ...  (parallel batch)")
+        print("       python ncaab_cli.py --server  (PDF paths on stdin, NDJSON on stdout)")
+        sys.exit(1)
+
+    if sys.argv[1] == "--server":
+        # Pay the parser/pdfplumber import cost once for a stream of PDFs
+        import gc
+        from parsers import _encode_json
+
+        gc_every = 50  # Files between full collections of pdfminer's object cycles
+        out = sys.stdout.buffer
+        parsed = 0
+        for line in sys.stdin:
+            path = line.strip()
+            if not path:
+                continue
+            parsed += 1
+            if parsed % gc_every == 0:
+                gc.collect()
+            try:
+                payload = _encode_json(parse_ncaab_pdf(path, backend, use_cache=True), indent=False)
+            except Exception as e:
+                payload = _encode_json({"pdf": path, "error": str(e)}, indent=False)
+            out.write(payload + b"\n")
+            out.flush()
+        sys.exit(0)
+
+    if len(sys.argv) > 2 and all(arg.lower().endswith('.pdf') for arg in sys.argv[1:]):
+        # Several PDFs: parsing is CPU-bound, so spread files across processes
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        paths = sys.argv[1:]
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(paths) // (workers * 4))
+        failed = 0
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for path, error in ex.map(partial(_convert_for_batch, backend=backend, indent=indent), paths, chunksize=chunksize):
+                if error:
+                    failed += 1
+                    print(f"Failed: {path}: {error}")
+        print(f"\nConverted {len(paths) - failed} of {len(paths)} PDFs")
+        sys.exit(1 if failed else 0)
+
+    pdf_path = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    # Preview from the parsed dict instead of decoding the JSON again
+    data = parse_ncaab_pdf(pdf_path, backend)
+    _save_json(data, pdf_path, output_path, indent)
+    print("\nPreview of parsed data:")
+    print(f"Game: {data['metadata'].get('away_team')} vs {data['metadata'].get('home_team')}")
+    print(f"Date: {data['metadata'].get('date')}")
+    print(f"Score: {data['metadata'].get('away_team_score')} - {data['metadata'].get('home_team_score')}")
+    print(f"Batting stats parsed: {len(data['box_score'].get('away_batting', []))} away, {len(data['box_score'].get('home_batting', []))} home")
+    print(f"Innings with play-by-play: {len(data['play_by_play'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,19 @@ This package contains parsers for converting NCAA baseball box score PDFs
 into structured JSON format.
 """
 
-import pdfplumber
 import json
+import os
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import Iterator, Optional
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
 
 from .models import PlayerBattingStats, PitcherStats, PlayEvent
 from .format_detection import detect_pdf_format
@@ -22,19 +31,61 @@ from .format_a import (
 )
 from .format_a_no_num import parse_format_a_no_num_box_score
 from .format_b import parse_format_b_box_score
-from .play_by_play import parse_play_by_play, parse_format_b_play_by_play
+from .play_by_play import (
+    parse_play_by_play,
+    parse_format_b_play_by_play,
+    _parse_play_by_play_lines,
+    _parse_format_b_play_by_play_lines,
+)
+from .pdf_backends import open_pdf
+
+
+def _join_pages(page_texts: list) -> str:
+    """Page texts as one string, each page followed by a newline."""
+    return "".join(text + "\n" for text in page_texts)
 
 
-def parse_ncaab_pdf(pdf_path: str) -> dict:
+def _page_lines(page_texts: list) -> Iterator[str]:
+    """Lines of the page texts in order, without joining them into one string."""
+    return chain.from_iterable(text.split("\n") for text in page_texts)
+
+
+def parse_ncaab_pdf(pdf_path: str, backend: str = 'pdfplumber', max_pages: Optional[int] = None,
+                    use_cache: bool = False) -> dict:
     """
     Main function to parse an NCAA baseball box score PDF.
 
     Args:
         pdf_path: Path to the PDF file
+        backend: Text-extraction backend: 'pdfplumber' (default), 'pymupdf' or 'playa'
+        max_pages: Only read the first N pages, for PDFs with trailing pages
+            (season stats, etc.) that aren't part of the game report
+        use_cache: Memoize on the file's resolved path, size and modification time,
+            for long-running callers (--server) that may see the same PDF again.
+            The returned dict is then shared between calls and must not be mutated.
 
     Returns:
         Dictionary containing all parsed game data
     """
+    if use_cache:
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
+            pass  # Leave the error (or non-file source) to the backend, uncached
+        else:
+            return _parse_ncaab_pdf_cached(os.path.realpath(pdf_path), backend, max_pages,
+                                           stat.st_mtime_ns, stat.st_size)
+    return _parse_ncaab_pdf(pdf_path, backend, max_pages)
+
+
+@lru_cache(maxsize=32)
+def _parse_ncaab_pdf_cached(pdf_path: str, backend: str, max_pages: Optional[int], mtime_ns: int, size: int) -> dict:
+    """_parse_ncaab_pdf memoized per file version (mtime_ns and size are only cache keys)."""
+    return _parse_ncaab_pdf(pdf_path, backend, max_pages)
+
+
+def _parse_ncaab_pdf(pdf_path: str, backend: str, max_pages: Optional[int]) -> dict:
+    """Uncached body of parse_ncaab_pdf."""
     result = {
         "metadata": {},
         "box_score": {},
@@ -43,11 +94,11 @@ def parse_ncaab_pdf(pdf_path: str) -> dict:
         "format": None
     }
 
-    with pdfplumber.open(pdf_path) as pdf:
-        full_text = ""
-        for page in pdf.pages:
-            page_text = page.extract_text() or ""
-            full_text += page_text + "\n"
+    with open_pdf(pdf_path, backend, max_pages) as pdf:
+        # Extracted once here and reused by the box-score and play-by-play
+        # parsers below
+        page_texts = [page.extract_text() or "" for page in pdf.pages]
+        full_text = _join_pages(page_texts)
 
         # Detect PDF format
         pdf_format = detect_pdf_format(full_text)
@@ -61,15 +112,11 @@ def parse_ncaab_pdf(pdf_path: str) -> dict:
             result["metadata"] = extract_format_b_metadata(full_text)
 
             # Parse box score from page 1 (format B has everything on page 1)
-            page1_text = pdf.pages[0].extract_text() or ""
+            page1_text = page_texts[0]
             result["box_score"] = parse_format_b_box_score(page1_text)
 
             # Parse play-by-play (starts on page 2 for format B)
-            pbp_text = ""
-            for page in pdf.pages[1:]:
-                page_text = page.extract_text() or ""
-                pbp_text += page_text + "\n"
-            result["play_by_play"] = parse_format_b_play_by_play(pbp_text)
+            result["play_by_play"] = _parse_format_b_play_by_play_lines(_page_lines(page_texts[1:]))
 
         elif pdf_format == 'format_a_no_num':
             # Format A without jersey numbers
@@ -77,16 +124,15 @@ def parse_ncaab_pdf(pdf_path: str) -> dict:
 
             # Parse box score from page 2
             if len(pdf.pages) >= 2:
-                result["box_score"] = parse_format_a_no_num_box_score(pdf.pages[1])
+                result["box_score"] = parse_format_a_no_num_box_score(pdf.pages[1], page_texts[1])
 
             # Parse play-by-play
-            pbp_text = ""
-            for page in pdf.pages[2:]:
-                page_text = page.extract_text() or ""
+            pbp_pages = []
+            for page_text in page_texts[2:]:
                 if 'Scoring Innings - Final' in page_text:
                     break
-                pbp_text += page_text + "\n"
-            result["play_by_play"] = parse_play_by_play(pbp_text)
+                pbp_pages.append(page_text)
+            result["play_by_play"] = _parse_play_by_play_lines(_page_lines(pbp_pages))
 
         else:
             # Use format A parsers (original format with jersey numbers)
@@ -94,16 +140,15 @@ def parse_ncaab_pdf(pdf_path: str) -> dict:
 
             # Parse box score (primarily from page 2)
             if len(pdf.pages) >= 2:
-                result["box_score"] = parse_box_score_from_tables(pdf.pages[1])
+                result["box_score"] = parse_box_score_from_tables(pdf.pages[1], page_texts[1])
 
             # Parse play-by-play (pages 3 onward)
-            pbp_text = ""
-            for page in pdf.pages[2:]:
-                page_text = page.extract_text() or ""
+            pbp_pages = []
+            for page_text in page_texts[2:]:
                 if 'Scoring Innings - Final' in page_text:
                     break
-                pbp_text += page_text + "\n"
-            result["play_by_play"] = parse_play_by_play(pbp_text)
+                pbp_pages.append(page_text)
+            result["play_by_play"] = _parse_play_by_play_lines(_page_lines(pbp_pages))
 
     # If venue-based validation detected teams should be swapped, swap them
     # Note: Only swap metadata team names, NOT the batting lineups
@@ -124,28 +169,49 @@ def parse_ncaab_pdf(pdf_path: str) -> dict:
     return result
 
 
-def convert_pdf_to_json(pdf_path: str, output_path: Optional[str] = None) -> str:
+def _encode_json(data: dict, indent: bool = True) -> bytes:
+    """Serialize parsed game data to UTF-8 JSON bytes (indented or compact)."""
+    if orjson is not None:
+        # Inning numbers are int keys, which orjson only accepts with OPT_NON_STR_KEYS
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _save_json(data: dict, pdf_path: str, output_path: Optional[str] = None, indent: bool = True) -> bytes:
+    """Write parsed game data as JSON (default: next to the PDF) and return the bytes written."""
+    if output_path is None:
+        output_path = str(Path(pdf_path).with_suffix('.json'))
+
+    # One UTF-8 encode; the same buffer is written to disk and returned
+    json_bytes = _encode_json(data, indent)
+    with open(output_path, 'wb') as f:
+        f.write(json_bytes)
+
+    print(f"Saved JSON to: {output_path}")
+    return json_bytes
+
+
+def convert_pdf_to_json(pdf_path: str, output_path: Optional[str] = None,
+                        backend: str = 'pdfplumber', as_bytes: bool = False,
+                        max_pages: Optional[int] = None):
     """
     Convert a PDF to JSON and optionally save to file.
 
     Args:
         pdf_path: Path to input PDF
         output_path: Optional path for output JSON (default: same name as PDF with .json extension)
+        backend: Text-extraction backend passed to parse_ncaab_pdf
+        as_bytes: Return the UTF-8 bytes written instead of decoding them to str
+        max_pages: Only read the first N pages (see parse_ncaab_pdf)
 
     Returns:
-        JSON string of parsed data
+        JSON string of parsed data (bytes if as_bytes)
     """
-    data = parse_ncaab_pdf(pdf_path)
-    json_str = json.dumps(data, indent=2)
-
-    if output_path is None:
-        output_path = str(Path(pdf_path).with_suffix('.json'))
-
-    with open(output_path, 'w') as f:
-        f.write(json_str)
-
-    print(f"Saved JSON to: {output_path}")
-    return json_str
+    json_bytes = _save_json(parse_ncaab_pdf(pdf_path, backend, max_pages), pdf_path, output_path)
+    return json_bytes if as_bytes else json_bytes.decode('utf-8')
 
 
 __all__ = [
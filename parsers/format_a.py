@@ -5,18 +5,42 @@ Format A is the original VMI at Virginia style with side-by-side stats and jerse
 """
 
 import re
-from dataclasses import asdict
+import sys
 from typing import Optional
 
 from .models import PlayerBattingStats, PitcherStats
 
 
-# Valid baseball positions
-VALID_POSITIONS = {
+# Valid baseball positions (immutable; interned to match the position
+# strings stored on parsed rows)
+VALID_POSITIONS = frozenset(sys.intern(p) for p in (
     'ss', 'cf', 'rf', 'lf', '1b', '2b', '3b', 'c', 'p', 'dh', 'ph',
     'ph/ss', 'ph/lf', 'ph/1b', 'ph/rf', 'ph/cf', 'ph/3b', 'ph/2b', 'ph/c', 'ph/dh',
     'pr', 'pr/ss', 'pr/lf', 'pr/rf'
-}
+))
+
+# Positions as box scores usually print them (lower, UPPER or Title case),
+# so most raw tokens can be tested without lowercasing a copy of each one
+_VALID_POSITIONS_ANYCASE = VALID_POSITIONS | frozenset(
+    variant for p in VALID_POSITIONS for variant in (p.upper(), p.title())
+)
+
+
+def _is_position(token: str) -> bool:
+    """True for a position token in any case, e.g. "ss", "PH/ss" or "pH"."""
+    return token in _VALID_POSITIONS_ANYCASE or token.lower() in VALID_POSITIONS
+
+# Page-text box score headers: pitching rows ("VMI ip h r ...") and team
+# rows with the record ("VMI 9 (2-2)", "Virginia 4 (2-2)")
+_VMI_PITCHING_HEADER_RE = re.compile(r'^VMI\s+ip\s+h\s+r', re.IGNORECASE)
+_VA_PITCHING_HEADER_RE = re.compile(r'^VA\s+ip\s+h\s+r', re.IGNORECASE)
+_VMI_RECORD_RE = re.compile(r'^VMI\s+\d+\s*\(\d+-\d+\)')
+_VIRGINIA_RECORD_RE = re.compile(r'^Virginia\s+\d+\s*\(\d+-\d+\)')
+
+
+def _is_float_token(token: str) -> bool:
+    """True for plain decimal tokens like "5", "5.1" or "-0.2" (innings pitched)."""
+    return token.replace('.', '', 1).lstrip('-').isdigit()
 
 
 def find_player_boundary(parts: list, start_idx: int) -> int:
@@ -27,31 +51,29 @@ def find_player_boundary(parts: list, start_idx: int) -> int:
     """
     # After the stats (9 numbers), look for a new jersey number
     # We need to count 9 numeric stats after the position
+    digit_mask = [p.isdigit() for p in parts]
     for i in range(start_idx, len(parts)):
-        if not parts[i].isdigit():
+        if not digit_mask[i]:
             continue
         # This might be a jersey number - check if there's a position within next 3 fields
         for j in range(i + 1, min(i + 4, len(parts))):
-            if parts[j].lower() in VALID_POSITIONS:
-                # Found position - verify this is a valid player start
-                # Check if there are 9 numbers after the position
-                pos_idx = j
-                remaining = parts[pos_idx + 1:]
-                if len(remaining) >= 9:
-                    try:
-                        # Try to parse the 9 stats
-                        [int(remaining[k]) for k in range(9)]
-                        return i
-                    except (ValueError, IndexError):
-                        continue
+            if _is_position(parts[j]):
+                # Found position - valid player start if 9 numbers follow it
+                stats = digit_mask[j + 1:j + 10]
+                if len(stats) == 9 and all(stats):
+                    return i
     return -1
 
 
 def parse_player_batting_line(line: str) -> Optional[PlayerBattingStats]:
     """Parse a single player batting line from box score."""
+    return _parse_player_batting_parts(line.split())
+
+
+def _parse_player_batting_parts(parts: list) -> Optional[PlayerBattingStats]:
+    """parse_player_batting_line on an already-split line."""
     # Pattern: # Player Pos ab r h rbi bb k po a lob
     # Example: 4 Eaton ss 5 0 0 0 0 1 3 3 5
-    parts = line.strip().split()
     if len(parts) < 11:
         return None
 
@@ -60,18 +82,19 @@ def parse_player_batting_line(line: str) -> Optional[PlayerBattingStats]:
         if not parts[0].isdigit():
             return None
 
+        at_bats, runs, hits, rbi, walks, strikeouts, put_outs, assists = map(int, parts[3:11])
         return PlayerBattingStats(
             number=parts[0],
             name=parts[1],
-            position=parts[2],
-            at_bats=int(parts[3]),
-            runs=int(parts[4]),
-            hits=int(parts[5]),
-            rbi=int(parts[6]),
-            walks=int(parts[7]),
-            strikeouts=int(parts[8]),
-            put_outs=int(parts[9]),
-            assists=int(parts[10]),
+            position=sys.intern(parts[2]),
+            at_bats=at_bats,
+            runs=runs,
+            hits=hits,
+            rbi=rbi,
+            walks=walks,
+            strikeouts=strikeouts,
+            put_outs=put_outs,
+            assists=assists,
             left_on_base=int(parts[11]) if len(parts) > 11 else 0
         )
     except (ValueError, IndexError):
@@ -90,17 +113,19 @@ def parse_pitcher_line(line: str) -> Optional[PitcherStats]:
         if not parts[0].isdigit():
             return None
 
+        innings_pitched = float(parts[2])
+        hits, runs, earned_runs, walks, strikeouts, batters_faced, at_bats = map(int, parts[3:10])
         return PitcherStats(
             number=parts[0],
             name=parts[1],
-            innings_pitched=float(parts[2]),
-            hits=int(parts[3]),
-            runs=int(parts[4]),
-            earned_runs=int(parts[5]),
-            walks=int(parts[6]),
-            strikeouts=int(parts[7]),
-            batters_faced=int(parts[8]),
-            at_bats=int(parts[9]),
+            innings_pitched=innings_pitched,
+            hits=hits,
+            runs=runs,
+            earned_runs=earned_runs,
+            walks=walks,
+            strikeouts=strikeouts,
+            batters_faced=batters_faced,
+            at_bats=at_bats,
             pitches=int(parts[10]) if len(parts) > 10 else 0
         )
     except (ValueError, IndexError):
@@ -117,7 +142,11 @@ def parse_side_by_side_batting_line(line: str) -> tuple:
 
     Returns tuple of (away_player, home_player) or (None, None) if not parseable.
     """
-    parts = line.strip().split()
+    return _parse_side_by_side_batting_parts(line.split())
+
+
+def _parse_side_by_side_batting_parts(parts: list) -> tuple:
+    """parse_side_by_side_batting_line on an already-split line."""
     if len(parts) < 22:  # Need at least 11 fields per team (with simple names)
         return (None, None)
 
@@ -125,7 +154,7 @@ def parse_side_by_side_batting_line(line: str) -> tuple:
         # First, find the away player's position
         away_pos_idx = None
         for i in range(1, min(5, len(parts))):  # Position should be in first few fields
-            if parts[i].lower() in VALID_POSITIONS:
+            if _is_position(parts[i]):
                 away_pos_idx = i
                 break
 
@@ -142,12 +171,12 @@ def parse_side_by_side_batting_line(line: str) -> tuple:
         away_position = parts[away_pos_idx]
         stats_start = away_pos_idx + 1
 
-        away_stats = [int(parts[stats_start + k]) for k in range(9)]
+        away_stats = list(map(int, parts[stats_start:stats_start + 9]))
 
         away_player = PlayerBattingStats(
             number=away_number,
             name=away_name,
-            position=away_position,
+            position=sys.intern(away_position),
             at_bats=away_stats[0],
             runs=away_stats[1],
             hits=away_stats[2],
@@ -168,7 +197,7 @@ def parse_side_by_side_batting_line(line: str) -> tuple:
         # Find home player's position
         home_pos_idx = None
         for i in range(home_start + 1, min(home_start + 5, len(parts))):
-            if parts[i].lower() in VALID_POSITIONS:
+            if _is_position(parts[i]):
                 home_pos_idx = i
                 break
 
@@ -185,12 +214,12 @@ def parse_side_by_side_batting_line(line: str) -> tuple:
         if home_stats_start + 9 > len(parts):
             return (away_player, None)
 
-        home_stats = [int(parts[home_stats_start + k]) for k in range(9)]
+        home_stats = list(map(int, parts[home_stats_start:home_stats_start + 9]))
 
         home_player = PlayerBattingStats(
             number=home_number,
             name=home_name,
-            position=home_position,
+            position=sys.intern(home_position),
             at_bats=home_stats[0],
             runs=home_stats[1],
             hits=home_stats[2],
@@ -225,12 +254,9 @@ def parse_single_pitcher(parts: list) -> Optional[PitcherStats]:
         ip_idx = None
         start_idx = 1 if has_jersey_number else 0
         for i in range(start_idx, min(start_idx + 4, len(parts))):
-            try:
-                float(parts[i])
+            if _is_float_token(parts[i]):
                 ip_idx = i
                 break
-            except ValueError:
-                continue
 
         if ip_idx is None:
             return None
@@ -244,18 +270,22 @@ def parse_single_pitcher(parts: list) -> Optional[PitcherStats]:
             name = ' '.join(parts[0:ip_idx])
 
         # Stats start at IP
+        innings_pitched = float(parts[ip_idx])
+        hits, runs, earned_runs, walks, strikeouts, batters_faced, at_bats, pitches = map(
+            int, parts[ip_idx + 1:ip_idx + 9]
+        )
         return PitcherStats(
             number=number,
             name=name,
-            innings_pitched=float(parts[ip_idx]),
-            hits=int(parts[ip_idx + 1]),
-            runs=int(parts[ip_idx + 2]),
-            earned_runs=int(parts[ip_idx + 3]),
-            walks=int(parts[ip_idx + 4]),
-            strikeouts=int(parts[ip_idx + 5]),
-            batters_faced=int(parts[ip_idx + 6]),
-            at_bats=int(parts[ip_idx + 7]),
-            pitches=int(parts[ip_idx + 8])
+            innings_pitched=innings_pitched,
+            hits=hits,
+            runs=runs,
+            earned_runs=earned_runs,
+            walks=walks,
+            strikeouts=strikeouts,
+            batters_faced=batters_faced,
+            at_bats=at_bats,
+            pitches=pitches
         )
     except (ValueError, IndexError):
         return None
@@ -271,7 +301,11 @@ def parse_side_by_side_pitching_line(line: str) -> tuple:
 
     Returns tuple of (away_pitcher, home_pitcher) or (None, None) if not parseable.
     """
-    parts = line.strip().split()
+    return _parse_side_by_side_pitching_parts(line.split())
+
+
+def _parse_side_by_side_pitching_parts(parts: list) -> tuple:
+    """parse_side_by_side_pitching_line on an already-split line."""
     if len(parts) < 10:
         return (None, None)
 
@@ -279,12 +313,9 @@ def parse_side_by_side_pitching_line(line: str) -> tuple:
         # First, find the away pitcher's IP (first float after jersey number)
         away_ip_idx = None
         for i in range(1, min(5, len(parts))):
-            try:
-                float(parts[i])
+            if _is_float_token(parts[i]):
                 away_ip_idx = i
                 break
-            except ValueError:
-                continue
 
         if away_ip_idx is None:
             return (None, None)
@@ -321,8 +352,11 @@ def parse_side_by_side_pitching_line(line: str) -> tuple:
         return (None, None)
 
 
-def parse_box_score_from_tables(pdf_page) -> dict:
-    """Parse box score using text parsing for side-by-side layout."""
+def parse_box_score_from_tables(pdf_page, text: Optional[str] = None) -> dict:
+    """Parse box score using text parsing for side-by-side layout.
+
+    Pass the page's already-extracted text as text to skip extracting it again.
+    """
     result = {
         "away_batting": [],
         "home_batting": [],
@@ -334,96 +368,89 @@ def parse_box_score_from_tables(pdf_page) -> dict:
         }
     }
 
-    text = pdf_page.extract_text() or ""
+    if text is None:
+        text = pdf_page.extract_text() or ""
     lines = text.split('\n')
 
-    in_batting_section = False
-    in_pitching_section = False
+    section = None  # 'batting' or 'pitching' while inside that table
 
     for i, line in enumerate(lines):
         stripped = line.strip()
+        lower = stripped.lower()
 
         # Detect batting section header (case-insensitive)
-        if '# player pos ab' in stripped.lower():
-            in_batting_section = True
-            in_pitching_section = False
+        if '# player pos ab' in lower:
+            section = 'batting'
             continue
 
         # Detect pitching section header (format: "VMI ip h r er bb k bf ab np VA ip...")
-        if re.match(r'^VMI\s+ip\s+h\s+r', stripped, re.IGNORECASE) or 'ip h r er bb k' in stripped.lower():
-            in_batting_section = False
-            in_pitching_section = True
+        if (lower.startswith('vmi') and _VMI_PITCHING_HEADER_RE.match(stripped)) or 'ip h r er bb k' in lower:
+            section = 'pitching'
             continue
 
-        # Detect end of sections
+        # Score by innings ends the tables; its team rows follow the header
         if 'Score by Innings' in stripped:
-            in_batting_section = False
-            in_pitching_section = False
+            section = None
+            for j in range(i+1, min(i+4, len(lines))):
+                score_line = lines[j].strip()
+                parts = score_line.split()
+                if len(parts) >= 13:
+                    team_name = parts[0]
+                    try:
+                        innings = list(map(int, parts[1:10]))
+                        if team_name == 'VMI':
+                            result["line_score"]["away_innings"] = innings
+                        elif team_name == 'Virginia':
+                            result["line_score"]["home_innings"] = innings
+                    except ValueError:
+                        pass
+            continue
 
         # Parse batting lines
-        if in_batting_section:
+        if section == 'batting':
+            parts = stripped.split()
+
             # Check for Totals line - but it might also contain last home player
             # Format: "Totals 36 9 12 8 10 5 27 9 11 18 Novak, J. 3b 2 1 1 0 2 0 1 3 0"
             if stripped.startswith('Totals'):
-                # Try to extract last home player from mixed line
-                parts = stripped.split()
                 # Skip "Totals" and the 9 numeric totals, then look for remaining player
                 if len(parts) > 10:
-                    # Check if there's a player after the totals
-                    remaining = ' '.join(parts[10:])  # Skip Totals + 9 stat columns
-                    if remaining:
-                        # Try to parse the remaining part as a single player
-                        home_player = parse_player_batting_line(remaining)
-                        if home_player:
-                            result["home_batting"].append(asdict(home_player))
-                in_batting_section = False
+                    # Try to parse the remaining part as a single player
+                    home_player = _parse_player_batting_parts(parts[10:])
+                    if home_player:
+                        result["home_batting"].append(home_player.to_dict())
+                section = None
                 continue
 
             # Try to parse side-by-side batting line
-            away_player, home_player = parse_side_by_side_batting_line(stripped)
+            away_player, home_player = _parse_side_by_side_batting_parts(parts)
             if away_player:
-                result["away_batting"].append(asdict(away_player))
+                result["away_batting"].append(away_player.to_dict())
             if home_player:
-                result["home_batting"].append(asdict(home_player))
+                result["home_batting"].append(home_player.to_dict())
 
         # Parse pitching lines
-        if in_pitching_section:
+        elif section == 'pitching':
             # Check for end markers
             if stripped.startswith('Win -') or stripped.startswith('WP -'):
-                in_pitching_section = False
+                section = None
                 continue
 
             # Try side-by-side pitching line first
-            away_pitcher, home_pitcher = parse_side_by_side_pitching_line(stripped)
+            away_pitcher, home_pitcher = _parse_side_by_side_pitching_parts(stripped.split())
             if away_pitcher and home_pitcher:
                 # Both teams have pitchers on this line
-                result["away_pitching"].append(asdict(away_pitcher))
-                result["home_pitching"].append(asdict(home_pitcher))
+                result["away_pitching"].append(away_pitcher.to_dict())
+                result["home_pitching"].append(home_pitcher.to_dict())
             elif away_pitcher and not home_pitcher:
                 # Only one pitcher on line - after side-by-side lines end,
                 # remaining single pitchers belong to home team
                 # (because away team exhausted their pitchers first in the PDF layout)
                 # Check if we already have home pitchers (meaning we've seen side-by-side lines)
                 if result["home_pitching"]:
-                    result["home_pitching"].append(asdict(away_pitcher))
+                    result["home_pitching"].append(away_pitcher.to_dict())
                 else:
-                    result["away_pitching"].append(asdict(away_pitcher))
-
-        # Parse score by innings
-        if 'Score by Innings' in stripped:
-            for j in range(i+1, min(i+4, len(lines))):
-                score_line = lines[j].strip()
-                parts = score_line.split()
-                if len(parts) >= 13:
-                    team_name = parts[0]
-                    try:
-                        innings = [int(parts[k]) for k in range(1, 10)]
-                        if team_name == 'VMI':
-                            result["line_score"]["away_innings"] = innings
-                        elif team_name == 'Virginia':
-                            result["line_score"]["home_innings"] = innings
-                    except ValueError:
-                        pass
+                    result["away_pitching"].append(away_pitcher.to_dict())
 
     return result
 
@@ -448,24 +475,26 @@ def parse_box_score_page_text(text: str) -> dict:
 
     for i, line in enumerate(lines):
         stripped = line.strip()
+        lower = stripped.lower()
 
-        # Detect section headers - look for team name with record
+        # Detect section headers - look for team name with record; the
+        # startswith tests rule out most lines before the regexes run
         # Away team header: "VMI 9 (2-2)"
-        if re.match(r'^VMI\s+\d+\s*\(\d+-\d+\)', stripped):
+        if stripped.startswith('VMI') and _VMI_RECORD_RE.match(stripped):
             current_section = "away_batting"
             found_away_batting = True
             continue
         # Home team header: "Virginia 4 (2-2)"
-        elif re.match(r'^Virginia\s+\d+\s*\(\d+-\d+\)', stripped):
+        elif stripped.startswith('Virginia') and _VIRGINIA_RECORD_RE.match(stripped):
             current_section = "home_batting"
             found_home_batting = True
             continue
         # Also detect from header row patterns
-        elif 'VMI' in stripped and '(' in stripped and 'ip' not in stripped.lower() and not found_away_batting:
+        elif 'VMI' in stripped and '(' in stripped and 'ip' not in lower and not found_away_batting:
             current_section = "away_batting"
             found_away_batting = True
             continue
-        elif 'Virginia' in stripped and '(' in stripped and 'ip' not in stripped.lower() and not found_home_batting:
+        elif 'Virginia' in stripped and '(' in stripped and 'ip' not in lower and not found_home_batting:
             current_section = "home_batting"
             found_home_batting = True
             continue
@@ -475,17 +504,17 @@ def parse_box_score_page_text(text: str) -> dict:
             player = parse_player_batting_line(stripped)
             if player:
                 if current_section == "away_batting":
-                    result["away_batting"].append(asdict(player))
+                    result["away_batting"].append(player.to_dict())
                 else:
-                    result["home_batting"].append(asdict(player))
+                    result["home_batting"].append(player.to_dict())
             elif 'Totals' in stripped:
                 current_section = None
 
         # Parse pitching section - look for "VMI ip h r" or "VA ip h r" patterns
-        if re.match(r'^VMI\s+ip\s+h\s+r', stripped, re.IGNORECASE):
+        if lower.startswith('vmi') and _VMI_PITCHING_HEADER_RE.match(stripped):
             current_section = "away_pitching"
             continue
-        elif re.match(r'^VA\s+ip\s+h\s+r', stripped, re.IGNORECASE):
+        elif lower.startswith('va') and _VA_PITCHING_HEADER_RE.match(stripped):
             current_section = "home_pitching"
             continue
 
@@ -493,9 +522,9 @@ def parse_box_score_page_text(text: str) -> dict:
             pitcher = parse_pitcher_line(stripped)
             if pitcher:
                 if current_section == "away_pitching":
-                    result["away_pitching"].append(asdict(pitcher))
+                    result["away_pitching"].append(pitcher.to_dict())
                 else:
-                    result["home_pitching"].append(asdict(pitcher))
+                    result["home_pitching"].append(pitcher.to_dict())
             # Check for end of pitching section
             if stripped.startswith('Win -') or stripped.startswith('WP -'):
                 current_section = None
@@ -507,12 +536,12 @@ def parse_box_score_page_text(text: str) -> dict:
                 parts = score_line.split()
                 if len(parts) >= 13 and parts[0] == 'VMI':
                     try:
-                        result["line_score"]["away_innings"] = [int(parts[k]) for k in range(1, 10)]
+                        result["line_score"]["away_innings"] = list(map(int, parts[1:10]))
                     except ValueError:
                         pass
                 elif len(parts) >= 13 and parts[0] == 'Virginia':
                     try:
-                        result["line_score"]["home_innings"] = [int(parts[k]) for k in range(1, 10)]
+                        result["line_score"]["home_innings"] = list(map(int, parts[1:10]))
                     except ValueError:
                         pass
 
@@ -5,11 +5,26 @@ Format B is the newer NCAA format with Team (record) -vs- Team (record) style.
 """
 
 import re
-from dataclasses import asdict
+import sys
 from typing import Optional
 
 from .models import PlayerBattingStats, PitcherStats
-from .format_a import VALID_POSITIONS
+from .format_a import _is_position
+
+
+# Patterns compiled once at import instead of looked up in re's cache per line
+_IP_STATS_RE = re.compile(r'\s(\d+\.\d)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)')
+_DECISION_SUFFIX_RE = re.compile(r'\s*\([WLS],?\s*[\d-]+\)\s*$')
+_PITCHING_HEADER_RE = re.compile(r'^([A-Za-z\s]+)\s+IP\s+H\s+R\s+ER')
+_PITCHER_BATTING_LINE_RE = re.compile(r'^\d+ p\b', re.IGNORECASE)
+# Seven whole numeric tokens in a row: one player's AB R H RBI BB SO LOB
+_SEVEN_STATS_RE = re.compile(r'(?:^|\s)(?:\d+\s+){6}\d+(?=\s|$)')
+
+# Game note lines that got mixed in with batting data start with stat
+# prefixes like "SH:", "2B:", "CS:", "E:", etc.
+_GAME_NOTE_PREFIXES = ('SH:', 'SF:', '2B:', '3B:', 'HR:', 'SB:', 'CS:', 'E:',
+                       'HBP:', 'IBB:', 'WP:', 'PB:', 'BK:', 'DP:', 'LOB:',
+                       'Totals', 'TOTALS')
 
 
 def parse_format_b_batting_line(line: str, has_position: bool = False) -> Optional[PlayerBattingStats]:
@@ -23,18 +38,24 @@ def parse_format_b_batting_line(line: str, has_position: bool = False) -> Option
     stripped = line.strip()
 
     # Skip game note lines that got mixed in with batting data
-    # These start with stat prefixes like "SH:", "2B:", "CS:", "E:", etc.
-    game_note_prefixes = ('SH:', 'SF:', '2B:', '3B:', 'HR:', 'SB:', 'CS:', 'E:',
-                          'HBP:', 'IBB:', 'WP:', 'PB:', 'BK:', 'DP:', 'LOB:',
-                          'Totals', 'TOTALS')
-    if any(stripped.startswith(prefix) for prefix in game_note_prefixes):
+    if stripped.startswith(_GAME_NOTE_PREFIXES):
         return None
 
     # Also skip lines that contain "Totals" anywhere (merged lines)
     if 'Totals' in stripped or 'TOTALS' in stripped:
         return None
 
-    parts = stripped.split()
+    return _parse_format_b_batting_parts(stripped.split())
+
+
+def _is_note_or_totals(parts: list) -> bool:
+    """True for the tokens of a line parse_format_b_batting_line skips."""
+    return (not parts or parts[0].startswith(_GAME_NOTE_PREFIXES)
+            or any('Totals' in part or 'TOTALS' in part for part in parts))
+
+
+def _parse_format_b_batting_parts(parts: list) -> Optional[PlayerBattingStats]:
+    """parse_format_b_batting_line on an already split, non-note line."""
     if len(parts) < 7:
         return None
 
@@ -45,20 +66,17 @@ def parse_format_b_batting_line(line: str, has_position: bool = False) -> Option
             # Look for a sequence of numbers (at least 5 in a row for AB R H RBI BB)
             if parts[i].isdigit():
                 # Check if next few are also digits
-                if i + 4 < len(parts):
-                    try:
-                        [int(parts[i+j]) for j in range(5)]
-                        stats_start = i
-                        break
-                    except ValueError:
-                        continue
+                if i + 4 < len(parts) and all(p.isdigit() for p in parts[i + 1:i + 5]):
+                    stats_start = i
+                    break
 
         if stats_start is None or stats_start < 1:
             return None
 
-        # Check if there's a position before stats
-        potential_pos = parts[stats_start - 1].lower()
-        if potential_pos in VALID_POSITIONS:
+        # Check if there's a position before stats (the usual cases are
+        # matched as printed; only odd casings need the lowercased copy)
+        potential_pos = parts[stats_start - 1]
+        if _is_position(potential_pos):
             name = ' '.join(parts[:stats_start - 1])
             position = parts[stats_start - 1]
         else:
@@ -66,12 +84,12 @@ def parse_format_b_batting_line(line: str, has_position: bool = False) -> Option
             position = ""
 
         # Parse stats: AB R H RBI BB SO LOB
-        stats = [int(parts[stats_start + i]) for i in range(7)]
+        stats = list(map(int, parts[stats_start:stats_start + 7]))
 
         return PlayerBattingStats(
             number="",  # Format B doesn't have jersey numbers
             name=name,
-            position=position,
+            position=sys.intern(position),
             at_bats=stats[0],
             runs=stats[1],
             hits=stats[2],
@@ -103,7 +121,7 @@ def parse_format_b_pitching_line(line: str) -> Optional[PitcherStats]:
     try:
         # Find IP value - look for pattern like "X.X" or single digit followed by numbers
         # IP is the first numeric value that looks like innings (0-9.0-9.2)
-        ip_match = re.search(r'\s(\d+\.\d)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)', stripped)
+        ip_match = _IP_STATS_RE.search(stripped)
         if not ip_match:
             return None
 
@@ -112,15 +130,11 @@ def parse_format_b_pitching_line(line: str) -> Optional[PitcherStats]:
         name = stripped[:ip_start].strip()
 
         # Remove win/loss record from name if present: "(W, 5-1)" or "(L, 6-2)" or "(S, 1)"
-        name = re.sub(r'\s*\([WLS],?\s*[\d-]+\)\s*$', '', name)
+        name = _DECISION_SUFFIX_RE.sub('', name)
 
         # Parse stats: IP H R ER BB SO (positions 1-6 of match)
         ip = float(ip_match.group(1))
-        h = int(ip_match.group(2))
-        r = int(ip_match.group(3))
-        er = int(ip_match.group(4))
-        bb = int(ip_match.group(5))
-        so = int(ip_match.group(6))
+        h, r, er, bb, so = map(int, ip_match.group(2, 3, 4, 5, 6))
 
         # Try to get additional stats (WP BK HBP IBB AB BF FO GO NP)
         remaining = stripped[ip_match.end(6):].strip().split()
@@ -175,8 +189,7 @@ def parse_format_b_box_score(text: str) -> dict:
     }
 
     lines = text.split('\n')
-    in_batting_section = False
-    in_pitching_section = False
+    section = None  # 'batting' or 'pitching' while inside that table
     current_pitching_team = None  # 'away' or 'home'
 
     for i, line in enumerate(lines):
@@ -184,15 +197,14 @@ def parse_format_b_box_score(text: str) -> dict:
 
         # Detect batting section header
         if 'Player AB R H RBI BB SO LOB' in stripped:
-            in_batting_section = True
-            in_pitching_section = False
+            section = 'batting'
             continue
 
         # Detect pitching section header - format: "Team IP H R ER BB SO..."
-        pitching_header_match = re.match(r'^([A-Za-z\s]+)\s+IP\s+H\s+R\s+ER', stripped)
+        # (the 'IP' test skips the backtracking team-name regex on other lines)
+        pitching_header_match = 'IP' in stripped and _PITCHING_HEADER_RE.match(stripped)
         if pitching_header_match:
-            in_batting_section = False
-            in_pitching_section = True
+            section = 'pitching'
             team_name = pitching_header_match.group(1).strip()
             # First pitching header is away team, second is home team
             if current_pitching_team is None:
@@ -203,18 +215,18 @@ def parse_format_b_box_score(text: str) -> dict:
 
         # Detect play by play section (end of box score)
         if 'Play By Play' in stripped or 'Play-By-Play' in stripped:
-            in_batting_section = False
-            in_pitching_section = False
             break
 
         # Detect end of pitching section (Win/Loss/Save lines)
         if stripped.startswith('Win:') or stripped.startswith('Loss:') or stripped.startswith('Save:'):
-            in_pitching_section = False
+            if section == 'pitching':
+                section = None
             continue
 
         # Detect score by innings
         if 'Score by Innings' in stripped:
-            in_batting_section = False
+            if section == 'batting':
+                section = None
             # Parse next two lines for team scores
             for j in range(i+1, min(i+4, len(lines))):
                 score_line = lines[j].strip()
@@ -241,66 +253,62 @@ def parse_format_b_box_score(text: str) -> dict:
                             break
 
         # Parse batting lines - format B has both teams side by side
-        if in_batting_section and stripped:
+        if section == 'batting' and stripped:
             # Skip totals and empty lines
-            if stripped.lower().startswith('totals') or stripped.lower().startswith('player'):
+            if stripped.lower().startswith(('totals', 'player')):
                 continue
-            if re.match(r'^\d+ p\b', stripped.lower()):  # Pitcher line like "0 0 0 0 0 0 0"
+            if stripped[0].isdigit() and _PITCHER_BATTING_LINE_RE.match(stripped):  # Pitcher line like "0 0 0 0 0 0 0"
                 continue
 
             # Try to split line into two players
             # Look for pattern where stats end and new name begins
             parts = stripped.split()
             if len(parts) >= 14:  # Likely two players
-                # Find the split point - after 7 numeric stats
+                # Find the split point - after the first run of 7 numeric
+                # stats (AB through LOB), counted in tokens
                 split_idx = None
-                num_count = 0
-                for idx, p in enumerate(parts):
-                    if p.isdigit():
-                        num_count += 1
-                        if num_count == 7:  # After LOB
-                            split_idx = idx + 1
-                            break
-                    elif num_count > 0 and not p.isdigit():
-                        # Reset if we hit non-number before getting 7
-                        num_count = 0
+                stats_run = _SEVEN_STATS_RE.search(stripped)
+                if stats_run:
+                    split_idx = len(stripped[:stats_run.end()].split())
 
                 if split_idx and split_idx < len(parts):
-                    away_line = ' '.join(parts[:split_idx])
-                    home_line = ' '.join(parts[split_idx:])
+                    # Parse each half's tokens directly rather than joining
+                    # them into a line for parse_format_b_batting_line to split
+                    away_parts = parts[:split_idx]
+                    home_parts = parts[split_idx:]
 
-                    away_player = parse_format_b_batting_line(away_line)
-                    home_player = parse_format_b_batting_line(home_line)
+                    away_player = None if _is_note_or_totals(away_parts) else _parse_format_b_batting_parts(away_parts)
+                    home_player = None if _is_note_or_totals(home_parts) else _parse_format_b_batting_parts(home_parts)
 
                     if away_player:
-                        result["away_batting"].append(asdict(away_player))
+                        result["away_batting"].append(away_player.to_dict())
                     if home_player:
-                        result["home_batting"].append(asdict(home_player))
+                        result["home_batting"].append(home_player.to_dict())
             else:
                 # Single player line
                 player = parse_format_b_batting_line(stripped)
                 if player:
                     # Determine team based on context
                     if len(result["away_batting"]) <= len(result["home_batting"]):
-                        result["away_batting"].append(asdict(player))
+                        result["away_batting"].append(player.to_dict())
                     else:
-                        result["home_batting"].append(asdict(player))
+                        result["home_batting"].append(player.to_dict())
 
         # Parse pitching lines
-        if in_pitching_section and stripped:
+        elif section == 'pitching' and stripped:
             # Skip totals line
             if stripped.lower().startswith('totals'):
                 continue
             # Skip non-pitching lines (game notes, etc.)
             if any(x in stripped for x in ['HR:', 'HBP:', 'DP:', '2B:', 'SH:', 'HBP:', 'SB:']):
-                in_pitching_section = False
+                section = None
                 continue
 
             pitcher = parse_format_b_pitching_line(stripped)
             if pitcher:
                 if current_pitching_team == 'away':
-                    result["away_pitching"].append(asdict(pitcher))
+                    result["away_pitching"].append(pitcher.to_dict())
                 else:
-                    result["home_pitching"].append(asdict(pitcher))
+                    result["home_pitching"].append(pitcher.to_dict())
 
     return result
@@ -4,6 +4,10 @@ PDF format detection for NCAA baseball box scores.
 
 import re
 
+# Format A without jersey numbers: "Player ab r h rbi bb k po a lob" (matched
+# against the lowercased text)
+_NO_NUM_HEADER_RE = re.compile(r'player\s+ab\s+r\s+h\s+rbi\s+bb\s+k\s+po\s+a\s+lob')
+
 
 def detect_pdf_format(text: str) -> str:
     """Detect which PDF format we're dealing with.
@@ -18,12 +22,13 @@ def detect_pdf_format(text: str) -> str:
     # Check for column headers
     if 'Player AB R H RBI BB SO LOB' in text:
         return 'format_b'
-    if '# player pos ab r h rbi bb k po a lob' in text.lower():
+    # Lowercase once for the remaining case-insensitive probes
+    lower = text.lower()
+    if '# player pos ab r h rbi bb k po a lob' in lower:
         return 'format_a'
-    # Format A without jersey numbers: "Player ab r h rbi bb k po a lob"
-    if re.search(r'Player\s+ab\s+r\s+h\s+rbi\s+bb\s+k\s+po\s+a\s+lob', text, re.IGNORECASE):
+    if _NO_NUM_HEADER_RE.search(lower):
         return 'format_a_no_num'
-    if ' at ' in text.lower() or ' @ ' in text:
+    if ' at ' in lower or ' @ ' in text:
         # Check if it has jersey numbers
         if '# Player Pos' in text:
             return 'format_a'
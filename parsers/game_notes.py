@@ -4,6 +4,98 @@ Game notes extraction from NCAA baseball box score PDFs.
 
 import re
 
+# Stat-line patterns; items are "Player count (season)" split on ';'
+_ERRORS_RE = re.compile(r'E\s*[-:]\s*([^;]+(?:;\s*[^;]+)*?)(?:;?\s*DP|;?\s*$|\n)')
+_DP_RE = re.compile(r'DP\s*[-:]\s*(\d+|[^.]+?)(?:\.|$|\n)')
+# 2B/3B/HR/SB entries, at line start (format A) or mid-line after ';' (format B),
+# each running to the next ';', the line end or another stat's prefix. One
+# alternative per stat, named after its notes key, so one scan finds all four.
+_EXTRA_BASES_SB_RE = re.compile(
+    r'(?:^|;\s*)(?:'
+    r'2B\s*[-:][ \t]*(?P<doubles>[^;]+?)(?=\s*;|\s*$|\s*(?:3B|HR|SB|CS|SH|SF|WP|PB|KL|HBP|GDP|LOB|DP|BK|IBB|E)\s*[-:])'
+    r'|3B\s*[-:][ \t]*(?P<triples>[^;]+?)(?=\s*;|\s*$|\s*(?:2B|HR|SB|CS|SH|SF|WP|PB|KL|HBP|GDP|LOB|DP|BK|IBB|E)\s*[-:])'
+    r'|HR\s*[-:][ \t]*(?P<home_runs>[^;]+?)(?=\s*;|\s*$|\s*(?:2B|3B|SB|CS|SH|SF|WP|PB|KL|HBP|GDP|LOB|DP|BK|IBB|E)\s*[-:])'
+    r'|SB\s*[-:][ \t]*(?P<stolen_bases>[^;]+?)(?=\s*;|\s*$|\s*(?:2B|3B|HR|CS|SH|SF|WP|PB|KL|HBP|GDP|LOB|DP|BK|IBB|E)\s*[-:])'
+    r')',
+    re.MULTILINE,
+)
+_WIN_RE = re.compile(r'Win\s*[-:]\s*([^(]+)\s*\((\d+-\d+)\)')
+_LOSS_RE = re.compile(r'Loss\s*[-:]\s*([^(]+)\s*\((\d+-\d+)\)')
+_SAVE_NONE_RE = re.compile(r'Save\s*[-:]\s*None', re.IGNORECASE)
+_SAVE_RE = re.compile(r'Save\s*[-:]\s*([^(\n]+)\s*\((\d+)\)')
+_WP_RE = re.compile(r'(?:^|;\s*)WP\s*[-:]\s*([^;]+?)(?=\s*;?\s*(?:HB|PB|SFA|SH|SF|BK)\s*[-:]|\s*;?\s*$)', re.MULTILINE)
+_HB_RE = re.compile(r'(?:^|;\s*)HB\s*[-:]\s*(.+?)(?=\s*;?\s*(?:WP|PB|SFA|SH|SF|BK)\s*[-:]|\s*;?\s*$)', re.MULTILINE)
+
+# Stats that only appear as their own "PREFIX - items" line, read in one pass
+_LINE_STATS = ('CS', 'HBP', 'GDP', 'PB', 'SH')
+
+# "Player count (season)" item, and "(count)" anywhere in an item
+_ITEM_RE = re.compile(r'([^(]+?)(?:\s*(\d+))?\s*\((\d+)\)')
+_PAREN_COUNT_RE = re.compile(r'\(\d+\)')
+
+# Items whose first word is another stat's prefix were picked up from a neighbouring stat
+_OTHER_STAT_PREFIXES = frozenset({
+    'sh', 'sf', 'sfa', 'hbp', 'cs', 'sb', 'gdp', 'lob', 'dp', 'wp', 'pb', 'bk', 'ibb', 'e',
+})
+_SKIP_PREFIXES = {
+    "doubles": _OTHER_STAT_PREFIXES | {'3b', 'hr'},
+    "triples": _OTHER_STAT_PREFIXES | {'2b', 'hr'},
+    "home_runs": _OTHER_STAT_PREFIXES,
+    "stolen_bases": frozenset({'cs', 'gdp', 'lob', 'dp', 'wp', 'pb', 'bk', 'ibb', 'e'}),
+}
+
+
+def _first_word(item: str) -> str:
+    """Lowercased first word of a non-empty note item, without a trailing '-'/':'."""
+    return item.split(None, 1)[0].rstrip('-:').lower()
+
+
+def _add_player_items(body: str, key: str, notes: dict) -> None:
+    """Append the "Player count (season)" items of one 2B/3B/HR/SB entry to notes[key].
+
+    Items that start with another stat's prefix are skipped, as are items
+    without a parenthesized season total (e.g. the "2B: Umpire Name" in the
+    umpire line) - except stolen bases, which are kept without totals.
+    """
+    skip = _SKIP_PREFIXES[key]
+    stolen_bases = key == "stolen_bases"
+    for item in body.split(';'):
+        item = item.strip()
+        if not item or _first_word(item) in skip or (stolen_bases and 'CS' in item):
+            continue
+        match = _ITEM_RE.match(item)
+        if match:
+            # The name is the start of the item, already checked for stat prefixes
+            notes[key].append({
+                "player": match.group(1).strip(),
+                "game_count": int(match.group(2)) if match.group(2) else 1,
+                "season_total": int(match.group(3))
+            })
+        elif stolen_bases:
+            notes[key].append({"player": item, "game_count": 1, "season_total": None})
+
+
+def _name_items(body: str) -> list:
+    """The ';'-separated items of a stat entry, stripped, without blanks or "None"."""
+    return [item for item in map(str.strip, body.split(';')) if item and item.lower() != 'none']
+
+
+def _line_stat_values(text: str) -> dict:
+    """Map each of _LINE_STATS to the text after its first "PREFIX - " / "PREFIX: " line."""
+    values = {}
+    for line in text.split('\n'):
+        if not line.startswith(_LINE_STATS):
+            continue
+        for prefix in _LINE_STATS:
+            if line.startswith(prefix):
+                rest = line[len(prefix):].lstrip()
+                if prefix not in values and rest[:1] in ('-', ':'):
+                    value = rest[1:].strip()
+                    if value:
+                        values[prefix] = value
+                break
+    return values
+
 
 def extract_game_notes(text: str) -> dict:
     """Extract additional game statistics from the notes section.
@@ -32,13 +124,13 @@ def extract_game_notes(text: str) -> dict:
     }
 
     # Extract errors: E - Player1 ; Player2 ; or E: Player
-    errors_match = re.search(r'E\s*[-:]\s*([^;]+(?:;\s*[^;]+)*?)(?:;?\s*DP|;?\s*$|\n)', text)
+    errors_match = _ERRORS_RE.search(text)
     if errors_match:
         errors_str = errors_match.group(1)
         notes["errors"] = [e.strip() for e in errors_str.split(';') if e.strip() and 'DP' not in e]
 
     # Extract double plays: DP - Team1 X or DP: X
-    dp_match = re.search(r'DP\s*[-:]\s*(\d+|[^.]+?)(?:\.|$|\n)', text)
+    dp_match = _DP_RE.search(text)
     if dp_match:
         dp_str = dp_match.group(1).strip()
         if dp_str.isdigit():
@@ -49,177 +141,82 @@ def extract_game_notes(text: str) -> dict:
                 if len(parts) == 2 and parts[1].isdigit():
                     notes["double_plays"][parts[0].strip()] = int(parts[1])
 
-    # Extract doubles: 2B - Player (season) ; or 2B: Player (count)
-    # Common stat prefixes to filter out
-    stat_prefixes = r'^(SH|SF|SFA|HBP|CS|SB|GDP|LOB|DP|WP|PB|BK|IBB|E|3B|HR)\b'
-    doubles_prefixes = r'^(SH|SF|SFA|HBP|CS|SB|GDP|LOB|DP|WP|PB|BK|IBB|E|3B|HR)\b'
-
-    # Use findall to capture ALL 2B entries
-    # Format A: "2B - Player (count)" at start of line
-    # Format B: "2B - Player (count)" mid-line, terminated by ; or next stat
-    # Note: "2B: Umpire Name" in umpire line doesn't have parentheses - skip those
-    doubles_matches = re.findall(r'(?:^|;\s*)2B\s*[-:]\s*([^;]+?)(?=\s*;|\s*$|\s*(?:3B|HR|SB|CS|SH|SF|WP|PB|KL|HBP|GDP|LOB|DP|BK|IBB|E)\s*[-:])', text, re.MULTILINE)
-    for doubles_line in doubles_matches:
-        for item in doubles_line.split(';'):
-            item = item.strip()
-            # Skip items that are clearly not doubles
-            if item and not re.match(doubles_prefixes, item, re.IGNORECASE):
-                match = re.match(r'([^(]+?)(?:\s*(\d+))?\s*\((\d+)\)', item)
-                if match:
-                    player_name = match.group(1).strip()
-                    # Skip if player name looks like a stat prefix
-                    if not re.match(doubles_prefixes, player_name, re.IGNORECASE):
-                        notes["doubles"].append({
-                            "player": player_name,
-                            "game_count": int(match.group(2)) if match.group(2) else 1,
-                            "season_total": int(match.group(3))
-                        })
-                # Don't add items without parentheses - they might be umpire names
-
-    # Extract triples: 3B - Player count (season) ;
-    # Use findall to capture ALL 3B entries (Format A at line start, Format B mid-line)
-    # Note: "3B: Umpire Name" in umpire line doesn't have parentheses - skip those
-    triples_prefixes = r'^(SH|SF|SFA|HBP|CS|SB|GDP|LOB|DP|WP|PB|BK|IBB|E|2B|HR)\b'
-    triples_matches = re.findall(r'(?:^|;\s*)3B\s*[-:]\s*([^;]+?)(?=\s*;|\s*$|\s*(?:2B|HR|SB|CS|SH|SF|WP|PB|KL|HBP|GDP|LOB|DP|BK|IBB|E)\s*[-:])', text, re.MULTILINE)
-    for triples_line in triples_matches:
-        for item in triples_line.split(';'):
-            item = item.strip()
-            if item and not re.match(triples_prefixes, item, re.IGNORECASE):
-                match = re.match(r'([^(]+?)(?:\s*(\d+))?\s*\((\d+)\)', item)
-                if match:
-                    player_name = match.group(1).strip()
-                    if not re.match(triples_prefixes, player_name, re.IGNORECASE):
-                        notes["triples"].append({
-                            "player": player_name,
-                            "game_count": int(match.group(2)) if match.group(2) else 1,
-                            "season_total": int(match.group(3))
-                        })
-                # Don't add items without parentheses - they might be umpire names
-
-    # Extract home runs: HR - Player count (season) ; or HR: Player (count)
-    # Use findall to capture ALL HR entries (Format A at line start, Format B mid-line)
-    hr_matches = re.findall(r'(?:^|;\s*)HR\s*[-:]\s*([^;]+?)(?=\s*;|\s*$|\s*(?:2B|3B|SB|CS|SH|SF|WP|PB|KL|HBP|GDP|LOB|DP|BK|IBB|E)\s*[-:])', text, re.MULTILINE)
-    for hr_line in hr_matches:
-        for item in hr_line.split(';'):
-            item = item.strip()
-            # Skip items that are clearly not home runs (SH, SF, HBP, CS, SB, etc.)
-            # Use word boundary \b to catch formats like "HBP - Player" or "SF Player"
-            stat_prefixes = r'^(SH|SF|SFA|HBP|CS|SB|GDP|LOB|DP|WP|PB|BK|IBB|E)\b'
-            if item and not re.match(stat_prefixes, item, re.IGNORECASE):
-                match = re.match(r'([^(]+?)(?:\s*(\d+))?\s*\((\d+)\)', item)
-                if match:
-                    player_name = match.group(1).strip()
-                    # Skip if player name looks like a stat prefix
-                    if not re.match(stat_prefixes, player_name, re.IGNORECASE):
-                        notes["home_runs"].append({
-                            "player": player_name,
-                            "game_count": int(match.group(2)) if match.group(2) else 1,
-                            "season_total": int(match.group(3))
-                        })
-
-    # Extract stolen bases: SB - Player count (season) ;
-    # Use findall to capture ALL SB entries (Format A at line start, Format B mid-line)
-    sb_prefixes = r'^(CS|GDP|LOB|DP|WP|PB|BK|IBB|E)\b'
-    sb_matches = re.findall(r'(?:^|;\s*)SB\s*[-:]\s*([^;]+?)(?=\s*;|\s*$|\s*(?:2B|3B|HR|CS|SH|SF|WP|PB|KL|HBP|GDP|LOB|DP|BK|IBB|E)\s*[-:])', text, re.MULTILINE)
-    for sb_line in sb_matches:
-        for item in sb_line.split(';'):
-            item = item.strip()
-            if item and 'CS' not in item and not re.match(sb_prefixes, item, re.IGNORECASE):
-                match = re.match(r'([^(]+?)(?:\s*(\d+))?\s*\((\d+)\)', item)
-                if match:
-                    player_name = match.group(1).strip()
-                    if not re.match(sb_prefixes, player_name, re.IGNORECASE):
-                        notes["stolen_bases"].append({
-                            "player": player_name,
-                            "game_count": int(match.group(2)) if match.group(2) else 1,
-                            "season_total": int(match.group(3))
-                        })
-                elif item and not re.match(sb_prefixes, item, re.IGNORECASE):
-                    notes["stolen_bases"].append({"player": item, "game_count": 1, "season_total": None})
+    # Extract doubles, triples, home runs and stolen bases in one scan:
+    # "2B - Player count (season) ; ..." or "2B: Player (count)"
+    # Format A: at start of line
+    # Format B: mid-line, terminated by ; or next stat
+    for match in _EXTRA_BASES_SB_RE.finditer(text):
+        key = match.lastgroup
+        assert key is not None  # Every alternative ends in a named group
+        _add_player_items(match.group(key), key, notes)
 
     # Extract caught stealing: CS - Player (count) ; (single line only)
-    cs_match = re.search(r'^CS\s*[-:]\s*(.+?)$', text, re.MULTILINE)
-    if cs_match:
-        for item in cs_match.group(1).split(';'):
-            item = item.strip()
-            if item and item.lower() != 'none':
-                notes["caught_stealing"].append(item)
+    line_stats = _line_stat_values(text)
+    cs_value = line_stats.get('CS')
+    if cs_value:
+        notes["caught_stealing"].extend(_name_items(cs_value))
 
     # Extract hit by pitch (batters): HBP - Player (count) ; or HBP: Player (count)
     # Note: Format B also has "HBP:" for pitchers who hit batters
-    hbp_match = re.search(r'^HBP\s*[-:]\s*(.+?)$', text, re.MULTILINE)
-    if hbp_match:
-        for item in hbp_match.group(1).split(';'):
-            item = item.strip()
-            if item and item.lower() != 'none':
-                notes["hit_by_pitch"].append(item)
+    hbp_value = line_stats.get('HBP')
+    if hbp_value:
+        notes["hit_by_pitch"].extend(_name_items(hbp_value))
 
     # Extract grounded into double play: GDP - Player ;
-    gdp_match = re.search(r'^GDP\s*[-:]\s*(.+?)$', text, re.MULTILINE)
-    if gdp_match:
-        for item in gdp_match.group(1).split(';'):
+    gdp_value = line_stats.get('GDP')
+    if gdp_value:
+        for item in gdp_value.split(';'):
             item = item.strip()
             if item and 'LOB' not in item:
                 notes["grounded_into_dp"].append(item)
 
     # Extract win/loss/save - both "Win - Player (record)" and "Win: Player (record)"
-    win_match = re.search(r'Win\s*[-:]\s*([^(]+)\s*\((\d+-\d+)\)', text)
+    win_match = _WIN_RE.search(text)
     if win_match:
         notes["win"] = {"player": win_match.group(1).strip(), "record": win_match.group(2)}
 
-    loss_match = re.search(r'Loss\s*[-:]\s*([^(]+)\s*\((\d+-\d+)\)', text)
+    loss_match = _LOSS_RE.search(text)
     if loss_match:
         notes["loss"] = {"player": loss_match.group(1).strip(), "record": loss_match.group(2)}
 
     # Check for "Save - None" FIRST before trying to parse a save with count
     # Otherwise the greedy regex can match across lines (e.g., "Save - None.\nWP - Pitcher (3)")
-    if re.search(r'Save\s*[-:]\s*None', text, re.IGNORECASE):
+    if _SAVE_NONE_RE.search(text):
         notes["save"] = None
     else:
         # Only match save on a single line to avoid capturing WP/HBP data
-        save_match = re.search(r'Save\s*[-:]\s*([^(\n]+)\s*\((\d+)\)', text)
+        save_match = _SAVE_RE.search(text)
         if save_match:
             notes["save"] = {"player": save_match.group(1).strip(), "count": int(save_match.group(2))}
 
     # Extract wild pitches: WP - Pitcher (count)
     # Format B has multiple stats on one line, so use lookahead to stop at next stat prefix
     # This ensures we don't capture HB data that follows WP on the same line
-    wp_match = re.search(r'(?:^|;\s*)WP\s*[-:]\s*([^;]+?)(?=\s*;?\s*(?:HB|PB|SFA|SH|SF|BK)\s*[-:]|\s*;?\s*$)', text, re.MULTILINE)
+    wp_match = _WP_RE.search(text)
     if wp_match:
-        for item in wp_match.group(1).split(';'):
-            item = item.strip()
-            if item and item.lower() != 'none':
-                # Only accept if it has a count in parentheses (avoids stray names)
-                if re.search(r'\(\d+\)', item):
-                    notes["wild_pitches"].append(item)
+        # Only accept items with a count in parentheses (avoids stray names)
+        notes["wild_pitches"].extend(
+            item for item in _name_items(wp_match.group(1)) if _PAREN_COUNT_RE.search(item)
+        )
 
     # Extract passed balls: PB - Player ; (single line only)
-    pb_match = re.search(r'^PB\s*[-:]\s*(.+?)$', text, re.MULTILINE)
-    if pb_match:
-        for item in pb_match.group(1).split(';'):
-            item = item.strip()
-            if item and item.lower() != 'none':
-                notes["passed_balls"].append(item)
+    pb_value = line_stats.get('PB')
+    if pb_value:
+        notes["passed_balls"].extend(_name_items(pb_value))
 
     # Extract sacrifice hits: SH - Player (count) (single line only)
-    sh_match = re.search(r'^SH\s*[-:]\s*(.+?)$', text, re.MULTILINE)
-    if sh_match:
-        notes["sacrifice_hits"] = []
-        for item in sh_match.group(1).split(';'):
-            item = item.strip()
-            if item and item.lower() != 'none':
-                notes["sacrifice_hits"].append(item)
+    sh_value = line_stats.get('SH')
+    if sh_value:
+        notes["sacrifice_hits"] = _name_items(sh_value)
 
     # Extract hit batters (pitchers who hit batters): HB - Pitcher count (season)
     # Format B has this inline: "HB - Turkington,A 3 (6) ; Dessart,S (1)"
     # Multiple pitchers may be listed, separated by semicolons, until next stat prefix
-    hb_match = re.search(r'(?:^|;\s*)HB\s*[-:]\s*(.+?)(?=\s*;?\s*(?:WP|PB|SFA|SH|SF|BK)\s*[-:]|\s*;?\s*$)', text, re.MULTILINE)
+    hb_match = _HB_RE.search(text)
     if hb_match:
-        for item in hb_match.group(1).split(';'):
-            item = item.strip()
-            if item and item.lower() != 'none':
-                # Only accept if it has a count in parentheses
-                if re.search(r'\(\d+\)', item):
-                    notes["hit_batters"].append(item)
+        # Only accept items with a count in parentheses
+        notes["hit_batters"].extend(
+            item for item in _name_items(hb_match.group(1)) if _PAREN_COUNT_RE.search(item)
+        )
 
     return notes
@@ -3,6 +3,39 @@ Metadata extraction from NCAA baseball box score PDFs.
 """
 
 import re
+from functools import lru_cache
+from typing import Optional
+
+# Format A
+_DATE_SLASH_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_DATE_MONTH_RE = re.compile(r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4})')
+_VENUE_RE = re.compile(r'at\s+([A-Za-z\s]+(?:Field|Stadium|Park|Center|Arena|Coliseum|Complex))\s*\(([^)\n]+)\)')
+_VENUE_FALLBACK_RE = re.compile(r'at\s+([^(\n]+?)\s*\(([^)\n]+)\)')
+_BOX_HEADER_RE = re.compile(r'(#\d+\s+)?([A-Za-z]+)\s+(\d+)\s+\((\d+-\d+)\)\s+(#\d+\s+)?([A-Za-z]+)\s+(\d+)\s+\((\d+-\d+)\)')
+_TEAM_SCORE_RE = re.compile(r'(#\d+\s+)?([A-Za-z\s\.]+?)\s+(\d+)\s+\((\d+-\d+)\)')
+_MATCHUP_RE = re.compile(r'^([A-Za-z]+)\s+at\s+(#?\d*\s*[A-Za-z]+)', re.MULTILINE)
+_RANKED_NAME_RE = re.compile(r'(#\d+)\s+(.+)')
+_START_RE = re.compile(r'Start:\s*(\d{1,2}:\d{2}\s*[AP]M)')
+_UMPIRES_RE = re.compile(r'Umpires\s*-\s*HP:\s*([^;]+);\s*1B:\s*([^;]+);\s*2B:\s*([^;]+);\s*3B:\s*([^.\n]+)')
+
+# Format B
+_B_MATCHUP_RE = re.compile(r"""
+    (?:\#\s*(\d+)\s+)?        # away rank
+    ([A-Za-z\s']+?)\s*         # away team
+    \(([^)]+)\)                # away record
+    \s*-vs-\s*
+    (?:\#\s*(\d+)\s+)?        # home rank
+    ([A-Za-z\s']+?)\s*         # home team
+    \(([^)]+)\)                # home record
+""", re.VERBOSE)
+_B_VENUE_RE = re.compile(r'at\s+([A-Za-z][A-Za-z\s,\.]+?)\s*\(([^)\n]+)\)')
+_B_VENUE_CITY_RE = re.compile(r'at\s+([A-Za-z][A-Za-z\s,\.]+?)(?:\n|$)')
+_B_GAME_CITY_RE = re.compile(r'\d\s+\(([A-Za-z][A-Za-z\s,\.]+?)(?:\)|$)')
+_B_ATTENDANCE_RE = re.compile(r'Attendance[:\s]+(\d[\d,]*)', re.IGNORECASE)
+_B_DURATION_RE = re.compile(r'Time[:\s]+(\d+:\d+)', re.IGNORECASE)
+_B_START_RE = re.compile(r'Start[:\s]+(\d{1,2}:\d{2}\s*(?:am|pm)?)', re.IGNORECASE)
+_B_WEATHER_RE = re.compile(r'Weather[:\s]+(.+?)(?:\n|$)', re.IGNORECASE)
+_B_UMPIRES_RE = re.compile(r'Umpires?[:\s]+(.+?)(?:\n|$)', re.IGNORECASE)
 
 
 # Map team names to their home cities/venues
@@ -32,6 +65,79 @@ TEAM_HOME_CITIES = {
 }
 
 
+@lru_cache(maxsize=256)
+def _home_city_re(team: str) -> 're.Pattern[str]':
+    """Alternation of a team's home cities/venues (just the team name if unknown)."""
+    return re.compile('|'.join(map(re.escape, TEAM_HOME_CITIES.get(team, [team]))))
+
+
+def _search_from_label(pattern: 're.Pattern[str]', label: str, text: str, lower: str) -> 'Optional[re.Match[str]]':
+    """pattern.search(text) for an IGNORECASE pattern starting with label.
+
+    IGNORECASE searches can't skip ahead to a literal prefix, so candidate
+    positions come from str.find on the lowercased text instead.
+    """
+    if len(lower) != len(text):  # Lowercasing changed offsets; search normally
+        return pattern.search(text)
+    start = lower.find(label)
+    while start != -1:
+        match = pattern.match(text, start)
+        if match:
+            return match
+        start = lower.find(label, start + 1)
+    return None
+
+
+@lru_cache(maxsize=256)
+def _score_line_re(away_team: str, home_team: str) -> 're.Pattern[str]':
+    """Format B final-score line "Away X Home Y" on its own line."""
+    return re.compile(rf'^{re.escape(away_team)}\s+(\d+)\s+{re.escape(home_team)}\s+(\d+)\s*$', re.MULTILINE)
+
+
+def _rank_before(text: str, team: str) -> Optional[str]:
+    """Rank written just before the first "#<digits> <team>" in text, e.g. "#18"."""
+    start = text.find(team)
+    while start != -1:
+        # Walk back over the whitespace, then the digits, then expect '#'
+        digits_end = start
+        while digits_end > 0 and text[digits_end - 1].isspace():
+            digits_end -= 1
+        digits_start = digits_end
+        while digits_start > 0 and text[digits_start - 1].isdecimal():
+            digits_start -= 1
+        if digits_end < start and digits_start < digits_end and digits_start > 0 and text[digits_start - 1] == '#':
+            return text[digits_start - 1:digits_end]
+        start = text.find(team, start + 1)
+    return None
+
+
+def _value_after(text: str, label: str, chars: Optional[str] = None) -> Optional[str]:
+    """Value following the first "<label> <value>" in text, e.g. "Attendance: 1,234".
+
+    The value is the run of chars after the label and any whitespace, or the
+    rest of that line when chars is None.
+    """
+    start = text.find(label)
+    while start != -1:
+        pos = start + len(label)
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if chars is None:
+            if pos < len(text):
+                end = text.find('\n', pos)
+                return text[pos:end] if end != -1 else text[pos:]
+            # Only whitespace is left: a blank value unless it was all newlines
+            return '' if text[start + len(label):].strip('\n') else None
+        else:
+            end = pos
+            while end < len(text) and text[end] in chars:
+                end += 1
+            if end > pos:
+                return text[pos:end]
+        start = text.find(label, start + 1)
+    return None
+
+
 def extract_game_metadata(text: str) -> dict:
     """Extract game metadata from PDF text (Format A)."""
     metadata = {
@@ -55,25 +161,25 @@ def extract_game_metadata(text: str) -> dict:
     }
 
     # Extract date (format: February 20, 2018 or 2/20/2018)
-    date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', text)
+    date_match = _DATE_SLASH_RE.search(text)
     if date_match:
         metadata["date"] = date_match.group(1)
     else:
-        date_match = re.search(r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4})', text)
+        date_match = _DATE_MONTH_RE.search(text)
         if date_match:
             metadata["date"] = date_match.group(1)
 
     # Extract venue/stadium and city
     # Format: "at Davenport Field (Charlottesville, Va.)"
     # Use non-greedy match constrained to single line to avoid matching distant parentheses
-    venue_match = re.search(r'at\s+([A-Za-z\s]+(?:Field|Stadium|Park|Center|Arena|Coliseum|Complex))\s*\(([^)\n]+)\)', text)
+    venue_match = _VENUE_RE.search(text)
     if venue_match:
         metadata["stadium"] = venue_match.group(1).strip()
         metadata["city"] = venue_match.group(2).strip()
         metadata["venue"] = f"{metadata['stadium']} ({metadata['city']})"
     else:
         # Fallback: try simpler pattern but constrain to same line
-        venue_match = re.search(r'at\s+([^(\n]+?)\s*\(([^)\n]+)\)', text)
+        venue_match = _VENUE_FALLBACK_RE.search(text)
         if venue_match:
             metadata["stadium"] = venue_match.group(1).strip()
             metadata["city"] = venue_match.group(2).strip()
@@ -82,7 +188,7 @@ def extract_game_metadata(text: str) -> dict:
     # Extract teams and scores - look for box score header format
     # "VMI 9 (2-2)" or "#18 Virginia 4 (2-2)" on same line
     # Also handles "VMI 9 (2-2) Virginia 4 (2-2)" format
-    box_header = re.search(r'(#\d+\s+)?([A-Za-z]+)\s+(\d+)\s+\((\d+-\d+)\)\s+(#\d+\s+)?([A-Za-z]+)\s+(\d+)\s+\((\d+-\d+)\)', text)
+    box_header = _BOX_HEADER_RE.search(text)
     if box_header:
         # Away team (first)
         metadata["away_team_rank"] = box_header.group(1).strip() if box_header.group(1) else None
@@ -97,8 +203,7 @@ def extract_game_metadata(text: str) -> dict:
         metadata["home_team_record"] = box_header.group(8)
     else:
         # Fallback: look for separate patterns
-        team_pattern = r'(#\d+\s+)?([A-Za-z\s\.]+?)\s+(\d+)\s+\((\d+-\d+)\)'
-        teams = re.findall(team_pattern, text[:1000])
+        teams = _TEAM_SCORE_RE.findall(text[:1000])
 
         if len(teams) >= 2:
             metadata["away_team_rank"] = teams[0][0].strip() if teams[0][0] else None
@@ -112,12 +217,12 @@ def extract_game_metadata(text: str) -> dict:
             metadata["home_team_record"] = teams[1][3]
 
     # Also look for title format: "VMI at Virginia" to confirm home/away
-    matchup = re.search(r'^([A-Za-z]+)\s+at\s+(#?\d*\s*[A-Za-z]+)', text, re.MULTILINE)
+    matchup = _MATCHUP_RE.search(text)
     if matchup:
         away_name = matchup.group(1).strip()
         home_match = matchup.group(2).strip()
         # Check if home team has a rank
-        home_rank_match = re.match(r'(#\d+)\s+(.+)', home_match)
+        home_rank_match = _RANKED_NAME_RE.match(home_match)
         if home_rank_match:
             if not metadata["home_team_rank"]:
                 metadata["home_team_rank"] = home_rank_match.group(1)
@@ -125,38 +230,38 @@ def extract_game_metadata(text: str) -> dict:
     # Look for rankings in page 1 format: "#18 Virginia" on its own line
     # Check for away team rank
     if not metadata["away_team_rank"] and metadata["away_team"]:
-        away_rank = re.search(rf'(#\d+)\s+{re.escape(metadata["away_team"])}', text)
+        away_rank = _rank_before(text, metadata["away_team"])
         if away_rank:
-            metadata["away_team_rank"] = away_rank.group(1)
+            metadata["away_team_rank"] = away_rank
 
     # Check for home team rank
     if not metadata["home_team_rank"] and metadata["home_team"]:
-        home_rank = re.search(rf'(#\d+)\s+{re.escape(metadata["home_team"])}', text)
+        home_rank = _rank_before(text, metadata["home_team"])
         if home_rank:
-            metadata["home_team_rank"] = home_rank.group(1)
+            metadata["home_team_rank"] = home_rank
 
     # Extract attendance
-    attendance_match = re.search(r'Attendance:\s*([\d,]+)', text)
-    if attendance_match:
-        metadata["attendance"] = int(attendance_match.group(1).replace(',', ''))
+    attendance = _value_after(text, 'Attendance:', '0123456789,')
+    if attendance:
+        metadata["attendance"] = int(attendance.replace(',', ''))
 
     # Extract duration
-    duration_match = re.search(r'Duration:\s*([\d:]+)', text)
-    if duration_match:
-        metadata["duration"] = duration_match.group(1)
+    duration = _value_after(text, 'Duration:', '0123456789:')
+    if duration:
+        metadata["duration"] = duration
 
     # Extract start time
-    start_match = re.search(r'Start:\s*(\d{1,2}:\d{2}\s*[AP]M)', text)
+    start_match = _START_RE.search(text)
     if start_match:
         metadata["start_time"] = start_match.group(1)
 
     # Extract weather
-    weather_match = re.search(r'Weather:\s*(.+?)(?:\n|$)', text)
-    if weather_match:
-        metadata["weather"] = weather_match.group(1).strip()
+    weather = _value_after(text, 'Weather:')
+    if weather is not None:
+        metadata["weather"] = weather.strip()
 
     # Extract umpires
-    umpires_match = re.search(r'Umpires\s*-\s*HP:\s*([^;]+);\s*1B:\s*([^;]+);\s*2B:\s*([^;]+);\s*3B:\s*([^.\n]+)', text)
+    umpires_match = _UMPIRES_RE.search(text)
     if umpires_match:
         metadata["umpires"] = {
             "home_plate": umpires_match.group(1).strip(),
@@ -176,11 +281,8 @@ def extract_game_metadata(text: str) -> dict:
 
     if away_team and home_team and venue_city:
         # Check if venue suggests teams should be swapped
-        away_home_cities = TEAM_HOME_CITIES.get(away_team, [away_team])
-        home_home_cities = TEAM_HOME_CITIES.get(home_team, [home_team])
-
-        away_in_venue = any(city_name in venue_city for city_name in away_home_cities)
-        home_in_venue = any(city_name in venue_city for city_name in home_home_cities)
+        away_in_venue = _home_city_re(away_team).search(venue_city) is not None
+        home_in_venue = _home_city_re(home_team).search(venue_city) is not None
 
         # Also check if team name is directly in venue
         if not away_in_venue:
@@ -223,10 +325,9 @@ def extract_format_b_metadata(text: str) -> dict:
     # 3. "Arizona (0) -vs- Coastal Carolina (0)" - single number (tournament series)
     # 4. "LMU (22-20) -vs- Saint Mary's (21-19)" - team names with apostrophes
     # Pattern handles: optional ranking, team name (including apostrophes), parenthesized record
-    matchup = re.search(
-        r"(?:#\s*(\d+)\s+)?([A-Za-z\s']+?)\s*\(([^)]+)\)\s*-vs-\s*(?:#\s*(\d+)\s+)?([A-Za-z\s']+?)\s*\(([^)]+)\)",
-        text
-    )
+    # The lazy team-name groups are retried from every letter of the text,
+    # so skip the search outright when there is no "-vs-" for it to find
+    matchup = _B_MATCHUP_RE.search(text) if '-vs-' in text else None
     if matchup:
         # Away team
         metadata["away_team_rank"] = f"#{matchup.group(1)}" if matchup.group(1) else None
@@ -239,7 +340,7 @@ def extract_format_b_metadata(text: str) -> dict:
         metadata["home_team_record"] = matchup.group(6)
 
     # Extract date - format: 6/17/2023 or M/D/YYYY
-    date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', text)
+    date_match = _DATE_SLASH_RE.search(text)
     if date_match:
         metadata["date"] = date_match.group(1)
 
@@ -257,7 +358,7 @@ def extract_format_b_metadata(text: str) -> dict:
 
     # First try: match "at X (Y)" on same line only (non-greedy, single line)
     # Exclude play-by-play patterns by requiring venue-like content
-    venue_match = re.search(r'at\s+([A-Za-z][A-Za-z\s,\.]+?)\s*\(([^)\n]+)\)', header_text)
+    venue_match = _B_VENUE_RE.search(header_text)
     if venue_match:
         part1 = venue_match.group(1).strip()
         part2 = venue_match.group(2).strip()
@@ -276,14 +377,14 @@ def extract_format_b_metadata(text: str) -> dict:
         metadata["venue"] = f"{metadata['stadium']} ({metadata['city']})"
     else:
         # Fallback: "at City, State" without parentheses (single line)
-        venue_match = re.search(r'at\s+([A-Za-z][A-Za-z\s,\.]+?)(?:\n|$)', header_text)
+        venue_match = _B_VENUE_CITY_RE.search(header_text)
         if venue_match:
             metadata["city"] = venue_match.group(1).strip()
             metadata["venue"] = metadata["city"]
         else:
             # Try format: "Game# (City, State" - extract from header line
             # Pattern: digit followed by space and opening paren with city
-            city_match = re.search(r'\d\s+\(([A-Za-z][A-Za-z\s,\.]+?)(?:\)|$)', header_text)
+            city_match = _B_GAME_CITY_RE.search(header_text)
             if city_match:
                 metadata["city"] = city_match.group(1).strip()
                 metadata["venue"] = metadata["city"]
@@ -291,34 +392,37 @@ def extract_format_b_metadata(text: str) -> dict:
     # Extract scores from line like "UCLA 5 LSU 9" (appears after score by innings)
     if metadata["away_team"] and metadata["home_team"]:
         # Pattern: "Team1 X Team2 Y" on its own line
-        pattern = rf'^{re.escape(metadata["away_team"])}\s+(\d+)\s+{re.escape(metadata["home_team"])}\s+(\d+)\s*$'
-        score_match = re.search(pattern, text, re.MULTILINE)
+        score_match = _score_line_re(metadata["away_team"], metadata["home_team"]).search(text)
         if score_match:
             metadata["away_team_score"] = int(score_match.group(1))
             metadata["home_team_score"] = int(score_match.group(2))
 
+    # The labels below are matched case-insensitively; lowercase once so each
+    # search can jump to its label with str.find
+    lower = text.lower()
+
     # Extract attendance
-    attendance_match = re.search(r'Attendance[:\s]+(\d[\d,]*)', text, re.IGNORECASE)
+    attendance_match = _search_from_label(_B_ATTENDANCE_RE, 'attendance', text, lower)
     if attendance_match:
         metadata["attendance"] = int(attendance_match.group(1).replace(',', ''))
 
     # Extract duration
-    duration_match = re.search(r'Time[:\s]+(\d+:\d+)', text, re.IGNORECASE)
+    duration_match = _search_from_label(_B_DURATION_RE, 'time', text, lower)
     if duration_match:
         metadata["duration"] = duration_match.group(1)
 
     # Extract start time
-    start_match = re.search(r'Start[:\s]+(\d{1,2}:\d{2}\s*(?:am|pm)?)', text, re.IGNORECASE)
+    start_match = _search_from_label(_B_START_RE, 'start', text, lower)
     if start_match:
         metadata["start_time"] = start_match.group(1)
 
     # Extract weather
-    weather_match = re.search(r'Weather[:\s]+(.+?)(?:\n|$)', text, re.IGNORECASE)
+    weather_match = _search_from_label(_B_WEATHER_RE, 'weather', text, lower)
     if weather_match:
         metadata["weather"] = weather_match.group(1).strip()
 
     # Extract umpires
-    umpires_match = re.search(r'Umpires?[:\s]+(.+?)(?:\n|$)', text, re.IGNORECASE)
+    umpires_match = _search_from_label(_B_UMPIRES_RE, 'umpire', text, lower)
     if umpires_match:
         metadata["umpires"]["list"] = umpires_match.group(1).strip()
 
@@ -2,11 +2,16 @@
 Data models for NCAA baseball parsing.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
+# __slots__ drops the per-instance __dict__ for the hundreds of rows parsed
+# per game; dataclass(slots=True) needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class PlayerBattingStats:
     number: str
     name: str
@@ -21,8 +26,18 @@ class PlayerBattingStats:
     assists: int
     left_on_base: int
 
+    def to_dict(self) -> dict:
+        """Same dict as dataclasses.asdict, without its recursive deep copy."""
+        return {
+            'number': self.number, 'name': self.name, 'position': self.position,
+            'at_bats': self.at_bats, 'runs': self.runs, 'hits': self.hits,
+            'rbi': self.rbi, 'walks': self.walks, 'strikeouts': self.strikeouts,
+            'put_outs': self.put_outs, 'assists': self.assists,
+            'left_on_base': self.left_on_base,
+        }
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class PitcherStats:
     number: str
     name: str
@@ -36,10 +51,27 @@ class PitcherStats:
     at_bats: int
     pitches: int
 
+    def to_dict(self) -> dict:
+        """Same dict as dataclasses.asdict, without its recursive deep copy."""
+        return {
+            'number': self.number, 'name': self.name,
+            'innings_pitched': self.innings_pitched, 'hits': self.hits,
+            'runs': self.runs, 'earned_runs': self.earned_runs, 'walks': self.walks,
+            'strikeouts': self.strikeouts, 'batters_faced': self.batters_faced,
+            'at_bats': self.at_bats, 'pitches': self.pitches,
+        }
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class PlayEvent:
     description: str
     pitch_count: Optional[str] = None  # e.g., "2-2 KBBK"
     rbi: int = 0
-    runs_scored: list = None
+    runs_scored: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Same dict as dataclasses.asdict, without its recursive deep copy."""
+        return {
+            'description': self.description, 'pitch_count': self.pitch_count,
+            'rbi': self.rbi, 'runs_scored': list(self.runs_scored),
+        }
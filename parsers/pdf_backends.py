@@ -0,0 +1,228 @@
+"""
+PDF text-extraction backends for NCAA baseball box scores.
+
+pdfplumber (pdfminer.six) is the default backend. PyMuPDF (MuPDF's C
+engine) and playa (a much faster pure-Python PDF parser) are optional;
+their pages are wrapped so they expose the same extract_text() method the
+format parsers call on pdfplumber pages.
+"""
+
+from types import ModuleType
+from typing import Any, List, Optional, Tuple, Union
+
+import pdfplumber
+
+pymupdf: Optional[ModuleType]
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # type: ignore[no-redef]  # PyMuPDF < 1.24 only ships the fitz name
+    except ImportError:
+        pymupdf = None
+
+playa: Optional[ModuleType]
+try:
+    import playa
+except ImportError:
+    playa = None
+
+BACKENDS = ('pdfplumber', 'pymupdf', 'playa')
+
+# Text objects whose tops are within this many points share a line
+# (matches pdfplumber's default y_tolerance)
+Y_TOLERANCE = 3
+
+
+def _objects_to_text(objects: list) -> str:
+    """Join positioned text objects into lines: bucket by top, then sort by x."""
+    lines: List[Tuple[float, List[Any]]] = []  # (top of first object, objects on the line)
+    for obj in sorted(objects, key=lambda o: (o["top"], o["x0"])):
+        if lines and obj["top"] - lines[-1][0] <= Y_TOLERANCE:
+            lines[-1][1].append(obj)
+        else:
+            lines.append((obj["top"], [obj]))
+    return "\n".join(
+        " ".join(o["text"] for o in sorted(line, key=lambda o: o["x0"]))
+        for _, line in lines
+    )
+
+
+class PdfplumberPage:
+    """pdfplumber page whose extract_text() result is computed once.
+
+    parse_ncaab_pdf reads each page for the full document text and again
+    for the box score or play-by-play; caching keeps pdfplumber from
+    re-running its word/line clustering on the same page. Once the text is
+    cached the page is closed, freeing its char objects and text map
+    instead of holding them until the whole PDF is closed.
+    """
+
+    def __init__(self, page):
+        self._page = page
+        self._text = None
+
+    def extract_text(self) -> str:
+        if self._text is None:
+            # Stream-order text with the default tolerances, pinned so a
+            # pdfplumber upgrade can't switch on the far slower layout mode
+            self._text = self._page.extract_text(
+                layout=False, use_text_flow=False, x_tolerance=3, y_tolerance=Y_TOLERANCE,
+            ) or ""
+            self._page.close()
+        return self._text
+
+    def __getattr__(self, name):
+        return getattr(self._page, name)
+
+
+class PdfplumberDocument:
+    """pdfplumber PDF with text-caching pages."""
+
+    def __init__(self, pdf):
+        self._pdf = pdf
+        self.pages = [PdfplumberPage(page) for page in pdf.pages]
+
+    def close(self) -> None:
+        self._pdf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _extract_objects_pymupdf(page) -> list:
+    """Positioned text lines of a PyMuPDF page as pdfplumber-style dicts.
+
+    MuPDF's blocks group text by paragraph, so the two halves of a
+    side-by-side box-score row can land in different blocks; working from
+    the individual lines lets _objects_to_text rebuild each row by position.
+    """
+    objects = []
+    for block in page.get_text("dict")["blocks"]:
+        for line in block.get("lines", ()):  # Image blocks have no lines
+            text = "".join(span["text"] for span in line["spans"]).strip()
+            if text:
+                x0, top, x1, bottom = line["bbox"]
+                objects.append({"text": text, "x0": x0, "top": top, "x1": x1, "bottom": bottom})
+    return objects
+
+
+class PyMuPDFPage:
+    """pdfplumber-style page wrapper around a PyMuPDF page."""
+
+    def __init__(self, page):
+        self._page = page
+        self._text = None
+
+    def extract_text(self) -> str:
+        if self._text is None:
+            self._text = _objects_to_text(_extract_objects_pymupdf(self._page))
+        return self._text
+
+
+class PyMuPDFDocument:
+    """pdfplumber-style document wrapper: a .pages list and context manager."""
+
+    def __init__(self, pdf_path: str, max_pages: Optional[int] = None):
+        assert pymupdf is not None  # open_pdf only picks this backend when installed
+        self._doc = pymupdf.open(pdf_path)
+        self.pages = [PyMuPDFPage(page) for page in self._doc.pages(0, max_pages)]
+
+    def close(self) -> None:
+        self._doc.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _extract_objects_playa(page) -> list:
+    """Positioned text objects of a playa page as pdfplumber-style dicts."""
+    objects = []
+    for obj in page.texts:
+        text = obj.chars.strip()
+        if text:
+            x0, top, x1, bottom = obj.bbox
+            objects.append({"text": text, "x0": x0, "top": top, "x1": x1, "bottom": bottom})
+    return objects
+
+
+class PlayaPage:
+    """pdfplumber-style page wrapper around a playa page."""
+
+    def __init__(self, page):
+        self._page = page
+        self._text = None
+
+    def extract_text(self) -> str:
+        if self._text is None:
+            self._text = _objects_to_text(_extract_objects_playa(self._page))
+        return self._text
+
+
+class PlayaDocument:
+    """pdfplumber-style document wrapper: a .pages list and context manager."""
+
+    def __init__(self, pdf_path: str, max_pages: Optional[int] = None):
+        assert playa is not None  # open_pdf only picks this backend when installed
+        self._doc = playa.open(pdf_path)
+        self.pages = [PlayaPage(page) for page in self._doc.pages[:max_pages]]
+
+    def close(self) -> None:
+        self._doc.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def _looks_garbled(text: str) -> bool:
+    """True when extracted text is unusable (no text layer or undecodable glyphs)."""
+    return not text.strip() or '\ufffd' in text
+
+
+def open_pdf(pdf_path: str, backend: str = 'pdfplumber', max_pages: Optional[int] = None):
+    """
+    Open a PDF with the requested text-extraction backend.
+
+    Falls back to pdfplumber when the requested library isn't installed or
+    its text for the first page looks garbled.
+
+    Args:
+        pdf_path: Path to the PDF file
+        backend: 'pdfplumber', 'pymupdf' or 'playa'
+        max_pages: Only load the first N pages (None loads all)
+
+    Returns:
+        Context manager with a .pages list of objects providing extract_text();
+        each page's text is extracted once and reused
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown PDF backend {backend!r} (expected one of {', '.join(BACKENDS)})")
+
+    doc: Optional[Union[PyMuPDFDocument, PlayaDocument]] = None
+    if backend == 'pymupdf' and pymupdf is not None:
+        doc = PyMuPDFDocument(pdf_path, max_pages)
+    elif backend == 'playa' and playa is not None:
+        doc = PlayaDocument(pdf_path, max_pages)
+
+    if doc is not None:
+        if doc.pages and not _looks_garbled(doc.pages[0].extract_text()):
+            return doc
+        doc.close()
+
+    # No laparams: pdfplumber only runs pdfminer's layout analysis when they
+    # are given, and extract_text() clusters chars itself.
+    # pdfplumber takes 1-based page numbers and only builds those pages
+    pages = list(range(1, max_pages + 1)) if max_pages is not None else None
+    return PdfplumberDocument(pdfplumber.open(pdf_path, pages=pages))
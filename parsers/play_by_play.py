@@ -3,34 +3,87 @@ Play-by-play parsing for NCAA baseball box scores.
 """
 
 import re
-
-
-def parse_innings_from_text(text: str) -> list:
-    """Extract runs per inning from score line."""
-    # Pattern: team name followed by numbers
-    pattern = r'^\s*(?:VMI|Virginia|[A-Za-z\s\.#\d]+)\s+([\d\s]+)\s+\d+\s+\d+\s+\d+\s+\d+\s*$'
-    innings = []
-    for line in text.split('\n'):
-        # Look for lines with score by innings data
-        parts = line.strip().split()
-        if len(parts) >= 13:  # At least 9 innings + R H E LOB
-            try:
-                # Try to extract 9 inning scores
-                innings = [int(parts[i]) for i in range(1, 10) if parts[i].isdigit()]
-                if len(innings) == 9:
-                    return innings
-            except (ValueError, IndexError):
-                continue
-    return innings
-
-
-def parse_format_b_play_by_play(text: str) -> dict:
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional
+
+# {inning number: {"top": [event, ...], "bottom": [event, ...]}}
+Innings = Dict[int, Dict[str, List[Dict[str, Any]]]]
+
+
+def _new_inning() -> Dict[str, List[Dict[str, Any]]]:
+    """Empty top/bottom lists for a new inning.
+
+    Headers index innings[n] so an inning is listed even if no plays follow.
+    """
+    return {"top": [], "bottom": []}
+
+# Line score: a team token, 9 inning runs and at least 3 more fields (R H E
+# LOB), all on one line ([^\S\n] is whitespace other than a newline)
+_INNINGS_LINE_RE = re.compile(
+    r'^[^\S\n]*\S+[^\S\n]+((?:\d+[^\S\n]+){8}\d+)(?:[^\S\n]+\S+){3,}[^\S\n]*$', re.MULTILINE
+)
+
+# Format B: "Team - Top/Bottom of Xth". Only the character before the dash is
+# matched instead of the whole team name, so non-header lines are rejected in
+# one linear scan rather than backtracking through every run of letters.
+_FORMAT_B_HALF_RE = re.compile(r'[A-Za-z\s]\s*-\s*(Top|Bottom)\s+of\s+(\d+)', re.IGNORECASE)
+_FORMAT_B_PITCH_COUNT_RE = re.compile(r'\((\d-\d\s*[BKFSX]*)\)')
+_RBI_RE = re.compile(r'(\d+)\s*RBI')
+_SCORE_ONLY_RE = re.compile(r'^\d+\s+\d+\s*$')
+
+# Format A line kinds, told apart by one match at the line start: "1st Inning"
+# headers, "RU 1st -" half innings, and the score ("VA 0 1 0 2"), inning
+# summary ("6 R, 4 H, 1 E, 1 LOB") and starter ("4/ss/Eaton") lines skipped
+# between plays. The kinds can't overlap (each needs a different character
+# after its leading token), so the alternation order doesn't matter.
+_LINE_KIND_RE = re.compile(
+    r'(?P<inning>(?P<inning_num>\d+)(?:st|nd|rd|th)\s+Inning)'
+    r'|(?P<team_inning>[A-Z]{2,3}\s+(?P<team_inning_num>\d+)(?:st|nd|rd|th)\s*-)'
+    r'|(?P<score_line>[A-Z]+\s+\d+\s+\d+\s+\d+\s+\d+)'
+    r'|(?P<inning_summary>\d+\s+R,\s+\d+\s+H,\s+\d+\s+E,\s+\d+\s+LOB)'
+    r'|(?P<starter>\d+/[a-z]+/)'
+)
+_TOP_OF_RE = re.compile(r'Top of (\d+)')
+_BOTTOM_OF_RE = re.compile(r'Bottom of (\d+)')
+_RUNS_SUMMARY_RE = re.compile(r'^\d+\s+R,')
+_PITCH_COUNT_RE = re.compile(r'\((\d-\d\s*[BKFS]*)\)')
+# Page header text, and the "VMI at Davenport Field" venue line printed with it
+_SKIP_SUBSTRINGS = ('Play By Play',)
+_VENUE_RE = re.compile(r'\bat [A-Z].*\b(?:Field|Stadium|Park|Ballpark)\b')
+
+
+def parse_innings_from_text(text: str) -> List[int]:
+    """Extract runs per inning from score line.
+
+    Returns the 9 inning scores from the first line shaped like a line
+    score (team, 9 inning runs, then R H E LOB), or [] if there is none.
+    """
+    match = _INNINGS_LINE_RE.search(text)
+    if match:
+        return list(map(int, match.group(1).split()))
+    return []
+
+
+def _rbi_count(text: str) -> int:
+    """RBIs credited in an event line that mentions RBI ("2 RBI", ", RBI" = 1)."""
+    rbi_match = _RBI_RE.search(text)
+    if rbi_match:
+        return int(rbi_match.group(1))
+    return 1 if ', RBI' in text else 0
+
+
+def parse_format_b_play_by_play(text: str) -> Innings:
     """Parse play-by-play from format B PDFs."""
-    innings = {}
-    current_inning = None
-    current_half = None
+    return _parse_format_b_play_by_play_lines(text.split('\n'))
 
-    lines = text.split('\n')
+
+def _parse_format_b_play_by_play_lines(lines: Iterable[str]) -> Innings:
+    """parse_format_b_play_by_play over lines, e.g. streamed from several pages."""
+    innings: DefaultDict[int, Dict[str, List[Dict[str, Any]]]] = defaultdict(_new_inning)
+    current_inning: Optional[int] = None
+    current_half: Optional[str] = None
+    # innings[current_inning][current_half], rebound whenever either changes
+    current_events: Optional[List[Dict[str, Any]]] = None
 
     for line in lines:
         stripped = line.strip()
@@ -39,34 +92,31 @@ def parse_format_b_play_by_play(text: str) -> dict:
         if not stripped:
             continue
 
-        # Detect team batting indicator - "Team - Top/Bottom of Xth"
-        half_match = re.search(r'([A-Za-z\s]+)\s*-\s*(Top|Bottom)\s+of\s+(\d+)', stripped, re.IGNORECASE)
+        # Detect team batting indicator - "Team - Top/Bottom of Xth" (only
+        # lines with a dash can match, so the rest skip the regex)
+        half_match = '-' in stripped and _FORMAT_B_HALF_RE.search(stripped)
         if half_match:
-            current_inning = int(half_match.group(3))
-            current_half = "top" if half_match.group(2).lower() == "top" else "bottom"
-            if current_inning not in innings:
-                innings[current_inning] = {"top": [], "bottom": []}
+            current_inning = int(half_match.group(2))
+            current_half = "top" if half_match.group(1).lower() == "top" else "bottom"
+            current_events = innings[current_inning][current_half]
             continue
 
         # Skip summary lines
-        if stripped.startswith('Runs:') or stripped.startswith('No play'):
+        if stripped.startswith(('Runs:', 'No play')):
             continue
 
         # Parse play events
-        if current_inning and current_half and stripped:
+        if current_events is not None:
+            # Skip if this looks like just a score line (just numbers)
+            if stripped[0].isdigit() and _SCORE_ONLY_RE.match(stripped):
+                continue
+
             # Extract pitch count if present
-            pitch_match = re.search(r'\((\d-\d\s*[BKFSX]*)\)', stripped)
+            pitch_match = '(' in stripped and _FORMAT_B_PITCH_COUNT_RE.search(stripped)
             pitch_count = pitch_match.group(1) if pitch_match else None
 
             # Check for RBI
-            rbi_match = re.search(r'(\d+)\s*RBI', stripped)
-            rbi = int(rbi_match.group(1)) if rbi_match else 0
-            if ', RBI' in stripped and not rbi_match:
-                rbi = 1
-
-            # Skip if this looks like just a score line (just numbers)
-            if re.match(r'^\d+\s+\d+\s*$', stripped):
-                continue
+            rbi = _rbi_count(stripped) if 'RBI' in stripped else 0
 
             event = {
                 "description": stripped,
@@ -74,22 +124,31 @@ def parse_format_b_play_by_play(text: str) -> dict:
                 "rbi": rbi
             }
 
-            innings[current_inning][current_half].append(event)
+            current_events.append(event)
 
-    return innings
+    return dict(innings)
 
 
-def parse_play_by_play(text: str) -> dict:
+def parse_play_by_play(text: str) -> Innings:
     """Parse play-by-play text into structured data."""
-    innings = {}
-    current_inning = None
-    current_half = None
-    in_scoring_summary = False
+    return _parse_play_by_play_lines(text.split('\n'))
 
-    lines = text.split('\n')
+
+def _parse_play_by_play_lines(lines: Iterable[str]) -> Innings:
+    """parse_play_by_play over lines, e.g. streamed from several pages."""
+    innings: DefaultDict[int, Dict[str, List[Dict[str, Any]]]] = defaultdict(_new_inning)
+    current_inning: Optional[int] = None
+    current_half: Optional[str] = None
+    # innings[current_inning][current_half], rebound whenever either changes
+    current_events: Optional[List[Dict[str, Any]]] = None
+    in_scoring_summary = False
 
     for line in lines:
         stripped = line.strip()
+        if not stripped:
+            continue
+        line_kind = _LINE_KIND_RE.match(stripped)
+        kind = line_kind.lastgroup if line_kind else None
 
         # Detect and skip "Scoring Innings" summary section
         if 'Scoring Innings' in stripped:
@@ -99,63 +158,58 @@ def parse_play_by_play(text: str) -> dict:
         # Skip content in scoring summary section
         if in_scoring_summary:
             # Check if we've reached actual play-by-play again (new page)
-            if re.match(r'^(\d+)(?:st|nd|rd|th)\s+Inning', stripped):
+            if kind == 'inning':
                 in_scoring_summary = False
             else:
                 continue
 
         # Detect inning headers
-        inning_match = re.match(r'^(\d+)(?:st|nd|rd|th)\s+Inning', stripped)
-        if inning_match:
-            current_inning = int(inning_match.group(1))
-            if current_inning not in innings:
-                innings[current_inning] = {"top": [], "bottom": []}
+        if line_kind is not None and kind == 'inning':
+            current_inning = int(line_kind.group('inning_num'))
+            inning_events = innings[current_inning]
+            if current_half is not None:
+                current_events = inning_events[current_half]
             continue
 
         # Detect half-inning - format 1: "Top of 1st batting"
         if 'Top of' in stripped and 'batting' in stripped.lower():
-            half_match = re.search(r'Top of (\d+)', stripped)
+            half_match = _TOP_OF_RE.search(stripped)
             if half_match:
                 current_inning = int(half_match.group(1))
-                if current_inning not in innings:
-                    innings[current_inning] = {"top": [], "bottom": []}
             current_half = "top"
+            if current_inning is not None:
+                current_events = innings[current_inning]["top"]
             continue
         elif 'Bottom of' in stripped and 'batting' in stripped.lower():
-            half_match = re.search(r'Bottom of (\d+)', stripped)
+            half_match = _BOTTOM_OF_RE.search(stripped)
             if half_match:
                 current_inning = int(half_match.group(1))
-                if current_inning not in innings:
-                    innings[current_inning] = {"top": [], "bottom": []}
             current_half = "bottom"
+            if current_inning is not None:
+                current_events = innings[current_inning]["bottom"]
             continue
 
         # Detect half-inning - format 2: "RU 1st -" or "VA 1st -" (team abbreviation + inning)
         # First occurrence of team is away (top), alternating after that
-        team_inning_match = re.match(r'^([A-Z]{2,3})\s+(\d+)(?:st|nd|rd|th)\s*-', stripped)
-        if team_inning_match:
-            inning_num = int(team_inning_match.group(2))
-            if inning_num not in innings:
-                innings[inning_num] = {"top": [], "bottom": []}
+        if line_kind is not None and kind == 'team_inning':
+            inning_num = int(line_kind.group('team_inning_num'))
             # Alternate between top and bottom based on whether we've seen this inning before
             if current_inning != inning_num:
                 current_inning = inning_num
                 current_half = "top"
             else:
                 current_half = "bottom"
+            current_events = innings[current_inning][current_half]
             # Don't continue - parse the rest of the line as events
-            remaining = stripped[team_inning_match.end():].strip()
+            remaining = stripped[line_kind.end():].strip()
             if remaining and remaining != 'No play.':
                 for event_text in remaining.split('.;'):
                     event_text = event_text.strip()
-                    if event_text and not re.match(r'^\d+\s+R,', event_text):
-                        pitch_match = re.search(r'\((\d-\d\s*[BKFS]*)\)', event_text)
+                    if event_text and not _RUNS_SUMMARY_RE.match(event_text):
+                        pitch_match = '(' in event_text and _PITCH_COUNT_RE.search(event_text)
                         pitch_count = pitch_match.group(1) if pitch_match else None
-                        rbi_match = re.search(r'(\d+)\s*RBI', event_text)
-                        rbi = int(rbi_match.group(1)) if rbi_match else 0
-                        if ', RBI' in event_text and not rbi_match:
-                            rbi = 1
-                        innings[current_inning][current_half].append({
+                        rbi = _rbi_count(event_text) if 'RBI' in event_text else 0
+                        current_events.append({
                             "description": event_text.rstrip('.'),
                             "pitch_count": pitch_count,
                             "rbi": rbi
@@ -163,34 +217,29 @@ def parse_play_by_play(text: str) -> dict:
             continue
 
         # Skip summary lines and headers
-        if not stripped or 'This Inning' in stripped or stripped.startswith('Score by'):
+        if 'This Inning' in stripped or stripped.startswith('Score by'):
             continue
-        if re.match(r'^[A-Z]+\s+\d+\s+\d+\s+\d+\s+\d+', stripped):  # Score line
+        # Skip score lines, inning summary lines like "6 R, 4 H, 1 E, 1 LOB."
+        # and starter lists like "4/ss/Eaton"
+        if kind in ('score_line', 'inning_summary', 'starter'):
             continue
-        if 'starters:' in stripped.lower():
+        # Lowercase only lines that could hold "Starters:" (needs a colon)
+        if ':' in stripped and 'starters:' in stripped.lower():
             continue
-        # Skip inning summary lines like "6 R, 4 H, 1 E, 1 LOB."
-        if re.match(r'^\d+\s+R,\s+\d+\s+H,\s+\d+\s+E,\s+\d+\s+LOB', stripped):
+        # Skip page headers and "<away> at <venue>" lines, wherever they fall
+        if any(sub in stripped for sub in _SKIP_SUBSTRINGS):
             continue
-        # Skip page headers
-        if 'Play By Play' in stripped or 'at Davenport Field' in stripped:
+        if ' at ' in stripped and _VENUE_RE.search(stripped):
             continue
 
         # Parse play events
-        if current_inning and current_half and stripped:
-            # Skip if line looks like inning summary "R H E L" or team starter list
-            if re.match(r'^\d+/[a-z]+/', stripped):  # Starter format: 4/ss/Eaton
-                continue
-
+        if current_events is not None:
             # Extract pitch count if present
-            pitch_match = re.search(r'\((\d-\d\s*[BKFS]*)\)', stripped)
+            pitch_match = '(' in stripped and _PITCH_COUNT_RE.search(stripped)
             pitch_count = pitch_match.group(1) if pitch_match else None
 
             # Check for RBI
-            rbi_match = re.search(r'(\d+)\s*RBI', stripped)
-            rbi = int(rbi_match.group(1)) if rbi_match else 0
-            if ', RBI' in stripped and not rbi_match:
-                rbi = 1
+            rbi = _rbi_count(stripped) if 'RBI' in stripped else 0
 
             event = {
                 "description": stripped,
@@ -198,6 +247,6 @@ def parse_play_by_play(text: str) -> dict:
                 "rbi": rbi
             }
 
-            innings[current_inning][current_half].append(event)
+            current_events.append(event)
 
-    return innings
+    return dict(innings)
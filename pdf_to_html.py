@@ -24,7 +24,7 @@ import json
 import time
 
 # Import our modules
-from ncaab_parser import parse_ncaab_pdf
+from parsers import parse_ncaab_pdf
 from name_matcher import NameMatcher, enrich_game_data
 from ncaab_html_generator import generate_html_page
 from bref_roster_scraper import search_team, fetch_roster, scraper, REQUEST_DELAY
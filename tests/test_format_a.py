@@ -0,0 +1,32 @@
+"""
+Tests for format A batting lines (side-by-side, with and without jersey numbers).
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.format_a import parse_side_by_side_batting_line
+from parsers.format_a_no_num import parse_format_a_no_num_batting_line
+
+
+class TestMixedCasePositions:
+    """Tests for positions printed in neither lower, UPPER nor Title case."""
+
+    def test_numbered_line(self):
+        """Test "PH/ss" and "pH" on a line with jersey numbers."""
+        away, home = parse_side_by_side_batting_line(
+            "4 Eaton PH/ss 5 0 0 0 0 1 3 3 5 7 Smith pH 4 1 1 0 0 0 0 0 0"
+        )
+
+        assert (away.number, away.name, away.position, away.at_bats) == ("4", "Eaton", "PH/ss", 5)
+        assert (home.number, home.name, home.position, home.at_bats) == ("7", "Smith", "pH", 4)
+
+    def test_line_without_numbers(self):
+        """Test "PH/ss" and "pH" on a line without jersey numbers."""
+        away, home = parse_format_a_no_num_batting_line(
+            "Eaton Jack PH/ss 5 0 0 0 0 1 3 3 5 Smith Joe pH 4 1 1 0 0 0 0 0 0"
+        )
+
+        assert (away.name, away.position, away.left_on_base) == ("Eaton Jack", "PH/ss", 5)
+        assert (home.name, home.position, home.runs) == ("Smith Joe", "pH", 1)
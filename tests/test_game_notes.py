@@ -0,0 +1,88 @@
+"""
+Tests for game notes extraction (2B/3B/HR/SB entries).
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.game_notes import extract_game_notes
+
+
+def _entry(player, game_count, season_total):
+    return {"player": player, "game_count": game_count, "season_total": season_total}
+
+
+class TestExtraBasesAndStolenBases:
+    """Tests for the 2B/3B/HR/SB entries read by one combined scan."""
+
+    def test_format_a_lines(self):
+        """Test one "PREFIX - items" line per stat."""
+        notes = extract_game_notes(
+            "2B - Smith 2 (5)\n"
+            "3B - Eaton (1)\n"
+            "HR - Novak 2 (4)\n"
+            "SB - Eaton 2 (7)"
+        )
+
+        assert notes["doubles"] == [_entry("Smith", 2, 5)]
+        assert notes["triples"] == [_entry("Eaton", 1, 1)]
+        assert notes["home_runs"] == [_entry("Novak", 2, 4)]
+        assert notes["stolen_bases"] == [_entry("Eaton", 2, 7)]
+
+    def test_multiple_stats_on_one_line(self):
+        """Test format B entries separated by ';' on a single line."""
+        notes = extract_game_notes("2B: West (10); HR: Levu 2 (12); SB: Curiel (9); 3B: Dugger (2)")
+
+        assert notes["doubles"] == [_entry("West", 1, 10)]
+        assert notes["triples"] == [_entry("Dugger", 1, 2)]
+        assert notes["home_runs"] == [_entry("Levu", 2, 12)]
+        assert notes["stolen_bases"] == [_entry("Curiel", 1, 9)]
+
+    def test_entry_stops_before_next_stat_prefix(self):
+        """Test that an entry ends where another "PREFIX:" starts."""
+        notes = extract_game_notes("2B: West (10) HR: Levu (12)")
+
+        assert notes["doubles"] == [_entry("West", 1, 10)]
+        assert notes["home_runs"] == []
+
+    @pytest.mark.parametrize("text,key,expected", [
+        ("HR:\tLevu (12)", "home_runs", [_entry("Levu", 1, 12)]),
+        ("2B -  \tWest 2 (10)", "doubles", [_entry("West", 2, 10)]),
+        ("2B:\nWest (10)", "doubles", [_entry("West", 1, 10)]),
+    ])
+    def test_whitespace_after_separator(self, text, key, expected):
+        """Test spaces, tabs and a line break between the separator and the player."""
+        assert extract_game_notes(text)[key] == expected
+
+    @pytest.mark.parametrize("text", ["2B -\nHR - Levu (12)", "2B: \nHR: Levu (12)"])
+    def test_empty_entry_does_not_swallow_next_line(self, text):
+        """Test that an empty entry leaves the following stat line to its own key."""
+        notes = extract_game_notes(text)
+
+        assert notes["doubles"] == []
+        assert notes["home_runs"] == [_entry("Levu", 1, 12)]
+
+    @pytest.mark.parametrize("text,key", [
+        ("HR - SF Bad (1)", "home_runs"),
+        ("HR - sb Lower (3)", "home_runs"),
+        ("3B - 2B Cruz (1)", "triples"),
+        ("SB: CS Smith (1)", "stolen_bases"),
+        ("SB: Lee CS (1)", "stolen_bases"),
+    ])
+    def test_skips_items_from_other_stats(self, text, key):
+        """Test that items starting with (or, for SB, mentioning) another stat are dropped."""
+        assert extract_game_notes(text)[key] == []
+
+    def test_requires_season_total_except_stolen_bases(self):
+        """Test that only stolen bases keep items without a parenthesized total."""
+        assert extract_game_notes("2B - Jones")["doubles"] == []
+        assert extract_game_notes("SB - Runner")["stolen_bases"] == [_entry("Runner", 1, None)]
+
+    def test_ignores_umpire_line(self):
+        """Test that "2B: Name" umpire assignments are not read as doubles."""
+        notes = extract_game_notes("Umpires - HP: Joe Blow; 1B: Ann X; 2B: Bob Y; 3B: Cal Z.")
+
+        assert notes["doubles"] == []
+        assert notes["triples"] == []
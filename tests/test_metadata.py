@@ -0,0 +1,172 @@
+"""
+Tests for box score metadata extraction (teams, ranks, records, venue).
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.metadata import extract_game_metadata, extract_format_b_metadata
+
+
+FORMAT_A_TEXT = (
+    "February 20, 2018\n"
+    "at Davenport Field (Charlottesville, Va.)\n"
+    "VMI 9 (2-2) Virginia 4 (2-2)\n"
+    "Attendance: 2,345\n"
+    "Duration: 3:05\n"
+    "Start: 3:00 PM\n"
+    "Weather: Sunny, 65\n"
+    "Umpires - HP: Joe Blow; 1B: Ann X; 2B: Bob Y; 3B: Cal Z.\n"
+)
+
+
+class TestFormatAMetadata:
+    """Tests for format A metadata."""
+
+    def test_unranked_teams_and_records(self):
+        """Test teams, scores and records from the box score header."""
+        meta = extract_game_metadata(FORMAT_A_TEXT)
+
+        assert meta["away_team"] == "VMI"
+        assert meta["away_team_score"] == 9
+        assert meta["away_team_record"] == "2-2"
+        assert meta["away_team_rank"] is None
+        assert meta["home_team"] == "Virginia"
+        assert meta["home_team_score"] == 4
+        assert meta["home_team_record"] == "2-2"
+        assert meta["home_team_rank"] is None
+
+    def test_game_details(self):
+        """Test date, venue, attendance, duration, start time, weather and umpires."""
+        meta = extract_game_metadata(FORMAT_A_TEXT)
+
+        assert meta["date"] == "February 20, 2018"
+        assert meta["stadium"] == "Davenport Field"
+        assert meta["city"] == "Charlottesville, Va."
+        assert meta["attendance"] == 2345
+        assert meta["duration"] == "3:05"
+        assert meta["start_time"] == "3:00 PM"
+        assert meta["weather"] == "Sunny, 65"
+        assert meta["umpires"] == {
+            "home_plate": "Joe Blow",
+            "first_base": "Ann X",
+            "second_base": "Bob Y",
+            "third_base": "Cal Z",
+        }
+
+    def test_blank_labels(self):
+        """Test labels without a usable value."""
+        meta = extract_game_metadata("Attendance:\nDuration: TBD\nWeather:   \n")
+
+        assert meta["attendance"] is None
+        assert meta["duration"] is None
+        assert meta["weather"] == ""
+
+    def test_ranks_in_header(self):
+        """Test ranks written in the box score header."""
+        meta = extract_game_metadata("2/20/2018\n#5 VMI 9 (2-2) #18 Virginia 4 (3-1)\n")
+
+        assert meta["away_team_rank"] == "#5"
+        assert meta["home_team_rank"] == "#18"
+        assert meta["home_team_record"] == "3-1"
+
+    def test_ranks_on_their_own_lines(self):
+        """Test "#N Team" lines elsewhere, skipping unranked and malformed mentions."""
+        meta = extract_game_metadata(
+            "2/20/2018\n"
+            "Virginia preview\n"
+            "#7 VMI\n"
+            "VMI 9 (2-2) Virginia 4 (3-1)\n"
+            "18 Virginia\n"
+            "#3Virginia\n"
+            "#18   Virginia\n"
+        )
+
+        assert meta["away_team_rank"] == "#7"
+        assert meta["home_team_rank"] == "#18"
+
+    def test_rank_from_matchup_title(self):
+        """Test the home rank from a "VMI at #18 Virginia" title."""
+        meta = extract_game_metadata("VMI at #18 Virginia\nVMI 9 (2-2) Virginia 4 (3-1)\n")
+
+        assert meta["away_team_rank"] is None
+        assert meta["home_team_rank"] == "#18"
+
+    @pytest.mark.parametrize("text,swapped", [
+        # The away team's home city/venue: the header order is wrong
+        ("at Davenport Field (Charlottesville, Va.)\nVirginia 4 (2-2) VMI 9 (2-2)\n", True),
+        # The away team's name in the venue itself
+        ("at Rice Stadium (Houston, Tex.)\nRice 4 (2-2) Baylor 9 (2-2)\n", True),
+        # The home team's venue: already in order
+        ("at Davenport Field (Charlottesville, Va.)\nVMI 9 (2-2) Virginia 4 (2-2)\n", False),
+    ])
+    def test_venue_based_team_swap(self, text, swapped):
+        """Test that a venue belonging to the away team flags the teams as swapped."""
+        assert extract_game_metadata(text)["_teams_swapped"] is swapped
+
+
+class TestFormatBMetadata:
+    """Tests for format B metadata."""
+
+    def test_ranked_teams(self):
+        """Test ranks, records, final score and labelled game details."""
+        meta = extract_format_b_metadata(
+            "# 15 UCLA (48-17) -vs- # 6 LSU (50-15)\n"
+            "6/17/2023 at Omaha, Neb. (Charles Schwab Field)\n"
+            "Score by Innings\n"
+            "UCLA 5 LSU 9\n"
+            "Start time TBD\n"
+            "Attendance: 24,000\n"
+            "Time: 3:12\n"
+            "Start: 6:05 pm\n"
+            "Weather: Clear, 80\n"
+            "Umpires: A Ump; B Ump\n"
+        )
+
+        assert meta["away_team"] == "UCLA"
+        assert meta["away_team_rank"] == "#15"
+        assert meta["away_team_record"] == "48-17"
+        assert meta["away_team_score"] == 5
+        assert meta["home_team"] == "LSU"
+        assert meta["home_team_rank"] == "#6"
+        assert meta["home_team_record"] == "50-15"
+        assert meta["home_team_score"] == 9
+        assert meta["stadium"] == "Charles Schwab Field"
+        assert meta["city"] == "Omaha, Neb."
+        assert meta["attendance"] == 24000
+        assert meta["duration"] == "3:12"
+        assert meta["start_time"] == "6:05 pm"
+        assert meta["weather"] == "Clear, 80"
+        assert meta["umpires"] == {"list": "A Ump; B Ump"}
+
+    def test_unranked_teams_with_conference_records(self):
+        """Test unranked teams and labels in other cases."""
+        meta = extract_format_b_metadata(
+            "Arizona (16-13, 9-5 PAC-12) -vs- California (16-12, 5-9 PAC-12)\n"
+            "4/1/2016 at Berkeley, Calif.\n"
+            "Arizona 3 California 2\n"
+            "ATTENDANCE: 1,234\n"
+            "TIME: 2:45\n"
+            "weather: Cloudy\n"
+        )
+
+        assert meta["away_team_rank"] is None
+        assert meta["home_team_rank"] is None
+        assert meta["away_team_record"] == "16-13, 9-5 PAC-12"
+        assert meta["home_team_record"] == "16-12, 5-9 PAC-12"
+        assert meta["away_team_score"] == 3
+        assert meta["home_team_score"] == 2
+        assert meta["city"] == "Berkeley, Calif."
+        assert meta["attendance"] == 1234
+        assert meta["duration"] == "2:45"
+        assert meta["weather"] == "Cloudy"
+
+    def test_text_that_changes_length_when_lowercased(self):
+        """Test label lookup when lowercasing shifts offsets ("İ" becomes two characters)."""
+        meta = extract_format_b_metadata("LMU (22-20) -vs- Saint Mary's (21-19)\n5/2/2019\nATTENDANCE 512 İ\n")
+
+        assert meta["away_team"] == "LMU"
+        assert meta["home_team"] == "Saint Mary's"
+        assert meta["attendance"] == 512
@@ -0,0 +1,84 @@
+"""
+Tests for play-by-play page header and venue line handling.
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.play_by_play import parse_play_by_play
+
+
+def _descriptions(innings, inning, half):
+    return [event["description"] for event in innings[inning][half]]
+
+
+class TestPageHeaders:
+    """Tests for the "Play By Play" header repeated at each page break."""
+
+    def test_skips_venue_subheader(self):
+        """Test that the "<away> at <venue>" line under the header is not a play."""
+        innings = parse_play_by_play(
+            "1st Inning\n"
+            "Top of 1st batting\n"
+            "Smith singled to left field.\n"
+            "Play By Play\n"
+            "VMI at Disharoon Park\n"
+            "Jones grounded out to ss.\n"
+        )
+
+        assert _descriptions(innings, 1, "top") == [
+            "Smith singled to left field.",
+            "Jones grounded out to ss.",
+        ]
+
+    def test_skips_venue_line_away_from_header(self):
+        """Test that a venue line is skipped even when it isn't right under the header."""
+        innings = parse_play_by_play(
+            "Play By Play\n"
+            "1st Inning\n"
+            "Top of 1st batting\n"
+            "Smith singled to left field.\n"
+            "Rice at Reckling Park\n"
+            "Jones grounded out to ss.\n"
+        )
+
+        assert _descriptions(innings, 1, "top") == [
+            "Smith singled to left field.",
+            "Jones grounded out to ss.",
+        ]
+
+    @pytest.mark.parametrize("play", [
+        "Jones picked off at second",
+        "Jones out at home, cf to c",
+        "Smith out at Home",
+    ])
+    def test_keeps_play_with_at_right_after_header(self, play):
+        """Test that a play mentioning a base survives a page break with no venue line."""
+        innings = parse_play_by_play(
+            "1st Inning\n"
+            "Top of 1st batting\n"
+            "Smith singled to left field.\n"
+            "Play By Play\n"
+            f"{play}\n"
+            "Lee flied out to cf.\n"
+        )
+
+        assert _descriptions(innings, 1, "top") == [
+            "Smith singled to left field.",
+            play,
+            "Lee flied out to cf.",
+        ]
+
+    def test_keeps_play_with_at_after_venue_line(self):
+        """Test that a capitalized base after the venue line is still a play."""
+        innings = parse_play_by_play(
+            "1st Inning\n"
+            "Top of 1st batting\n"
+            "Play By Play\n"
+            "VMI at Davenport Field\n"
+            "Jones picked off at Second\n"
+        )
+
+        assert _descriptions(innings, 1, "top") == ["Jones picked off at Second"]
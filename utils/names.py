@@ -22,6 +22,11 @@ UPPERCASE_TEAMS = {
     'FGCU', 'CSUN', 'PFW', 'NIU', 'UIW', 'VCU', 'LIU'
 }
 
+# Trailing initials like ", J." or ", PJ" (normalize_name_for_matching)
+_MATCHING_SUFFIX_RE = re.compile(r',\s*[a-z\.]+$')
+# Translation table that deletes periods
+_NO_PERIODS = str.maketrans('', '', '.')
+
 
 def clean_player_name(name: str) -> str:
     """
@@ -136,11 +141,10 @@ def normalize_name_for_matching(name: str) -> str:
     # Convert to lowercase
     name = name.lower()
     # Remove common suffixes like ", J." or ", PJ"
-    name = re.sub(r',\s*[a-z\.]+$', '', name)
-    # Remove periods and extra spaces
-    name = re.sub(r'\.', '', name)
-    name = re.sub(r'\s+', ' ', name).strip()
-    return name
+    name = _MATCHING_SUFFIX_RE.sub('', name)
+    # Remove periods and collapse/strip whitespace
+    name = name.translate(_NO_PERIODS)
+    return ' '.join(name.split())
 
 
 def normalize_lookup_name(name: str) -> str:
@@ -64,11 +64,11 @@ def test_imports() -> bool:
     except ImportError as e:
         errors.append(f"  ✗ baseball_processor: {e}")
 
-    # Test baseball_processor.main imports from ncaab_parser
+    # Test baseball_processor.main imports from parsers
     try:
         # This is how main.py imports it
         sys.path.insert(0, str(Path(__file__).parent))
-        from ncaab_parser import parse_ncaab_pdf as main_parse
+        from parsers import parse_ncaab_pdf as main_parse
         print("  ✓ baseball_processor/main.py style import works")
     except ImportError as e:
         errors.append(f"  ✗ baseball_processor/main.py style import: {e}")
@@ -102,7 +102,7 @@ def normalize_html(html: str) -> str:
 def test_pdf_parsing(pdf_path: Path) -> Optional[dict]:
     """Parse a PDF and return the result."""
     try:
-        from ncaab_parser import parse_ncaab_pdf
+        from parsers import parse_ncaab_pdf
         result = parse_ncaab_pdf(str(pdf_path))
         return result
     except Exception as e: